@@ -5,25 +5,62 @@
 Shared Blender utilities for ComfyUI-GeometryPack nodes.
 
 This module provides common functionality for interacting with Blender,
-including finding the Blender executable, running scripts, and managing
-temporary files.
+including finding the Blender executable, running scripts (one-shot or in
+a persistent worker process), and exchanging meshes with Blender.
 """
 
 import os
+import sys
+import json
+import time
+import queue
+import atexit
+import collections
 import subprocess
 import tempfile
 import shutil
+import threading
+import functools
 from pathlib import Path
+import numpy as np
 import trimesh as trimesh_module
 
+# ComfyUI's cancel button (Blender jobs are killed when the prompt is interrupted)
+try:
+    import comfy.model_management as model_management
+    INTERRUPT_AVAILABLE = True
+except ImportError:
+    INTERRUPT_AVAILABLE = False
 
+
+# Static scripts executed inside Blender (see run_blender_mesh_script)
+BLENDER_SCRIPTS_DIR = Path(__file__).parent / "blender_scripts"
+
+# tmpfs mount used for Blender I/O when available (see _temp_root)
+_SHM_DIR = '/dev/shm'
+
+# Lines of Blender output kept for error messages; older lines are dropped
+_LOG_TAIL_LINES = 200
+
+# Default cap on Blender's worker threads (override with GEOMPACK_BLENDER_THREADS)
+_DEFAULT_BLENDER_THREADS = 8
+
+# How often a running Blender job checks for a ComfyUI interrupt, in seconds
+_INTERRUPT_POLL_SECONDS = 0.25
+
+
+@functools.lru_cache(maxsize=None)
 def find_blender():
     """
     Find Blender executable on the system.
 
     Checks in order:
-    1. Local installation in _blender/ (downloaded by install.py)
-    2. System installation (PATH or common locations)
+    1. GEOMPACK_BLENDER_PATH, then BLENDER_PATH environment variable
+    2. Local installation in _blender/ (downloaded by install.py)
+    3. System installation (PATH, then known locations for this platform)
+
+    The result is cached for the lifetime of the process; a failed lookup
+    is not cached, so installing Blender later is picked up.
 
     Returns:
         str: Path to Blender executable
@@ -31,40 +68,35 @@ def find_blender():
     Raises:
         RuntimeError: If Blender not found
     """
+    for env_var in ('GEOMPACK_BLENDER_PATH', 'BLENDER_PATH'):
+        env_path = os.environ.get(env_var)
+        if env_path and os.path.exists(env_path):
+            print(f"[Blender] Using {env_var}: {env_path}")
+            return env_path
+
     # Get the directory containing this file
     current_dir = Path(__file__).parent.parent.parent  # Go up from nodes/_utils/ to package root
     local_blender_dir = current_dir / "_blender"
 
-    # First, check for local Blender installation
+    # Check for local Blender installation (single directory walk)
     if local_blender_dir.exists():
-        # Search for blender executable in _blender/
-        blender_executables = []
-
-        # Windows
-        blender_executables.extend(list(local_blender_dir.rglob("blender.exe")))
-
-        # Linux/macOS
-        blender_executables.extend([
-            p for p in local_blender_dir.rglob("blender")
-            if p.is_file() and os.access(p, os.X_OK)
-        ])
-
-        if blender_executables:
-            blender_path = str(blender_executables[0])
-            print(f"[Blender] Using local Blender: {blender_path}")
-            return blender_path
+        for p in local_blender_dir.rglob("blender*"):
+            if p.name == "blender.exe" or (
+                p.name == "blender" and p.is_file() and os.access(p, os.X_OK)
+            ):
+                blender_path = str(p)
+                print(f"[Blender] Using local Blender: {blender_path}")
+                return blender_path
 
     # Fall back to system installation
-    common_paths = [
-        'blender',  # In PATH
-        '/Applications/Blender.app/Contents/MacOS/Blender',  # macOS
-        'C:\\Program Files\\Blender Foundation\\Blender\\blender.exe',  # Windows
-        '/usr/bin/blender',  # Linux
-        '/usr/local/bin/blender',  # Linux
-    ]
-
-    for path in common_paths:
-        if shutil.which(path) or os.path.exists(path):
+    path = shutil.which('blender')
+    if path:
+        print(f"[Blender] Found system Blender: {path}")
+        return path
+
+    # Absolute candidates only need an existence check, not a PATH lookup
+    for path in _platform_candidates():
+        if os.path.exists(path):
             print(f"[Blender] Found system Blender: {path}")
             return path
 
@@ -74,6 +106,56 @@ def find_blender():
     )
 
 
+@functools.lru_cache(maxsize=None)
+def blender_version():
+    """
+    Version line Blender reports (e.g. "Blender 4.2.0"), or None if unavailable.
+
+    Runs Blender once per process; used to tell results of different Blender
+    releases apart (see result_cache).
+    """
+    try:
+        result = subprocess.run([find_blender(), '--version'], capture_output=True,
+                                text=True, timeout=60)
+    except (RuntimeError, OSError, subprocess.SubprocessError) as e:
+        print(f"[Blender] Could not read Blender version: {e}")
+        return None
+    lines = result.stdout.strip().splitlines()
+    return lines[0].strip() if lines else None
+
+
+def _platform_candidates():
+    """Known Blender install locations for the current platform."""
+    if sys.platform == 'darwin':
+        return ['/Applications/Blender.app/Contents/MacOS/Blender']
+    if sys.platform == 'win32':
+        return ['C:\\Program Files\\Blender Foundation\\Blender\\blender.exe']
+    return ['/usr/bin/blender', '/usr/local/bin/blender']
+
+
+def _blender_threads():
+    """
+    Thread count passed to Blender's --threads.
+
+    Blender otherwise starts a thread per core, which costs start-up time
+    and oversubscribes the CPU when several Blender jobs run at once; the
+    voxel and Quadriflow remeshers gain little beyond a handful of threads.
+    """
+    configured = os.environ.get('GEOMPACK_BLENDER_THREADS')
+    if configured:
+        try:
+            return max(0, int(configured))  # 0 lets Blender use every core
+        except ValueError:
+            print(f"[Blender] Ignoring invalid GEOMPACK_BLENDER_THREADS={configured!r}")
+    return min(_DEFAULT_BLENDER_THREADS, os.cpu_count() or 1)
+
+
+def _blender_command(*args):
+    """Command line for a background Blender run with the given trailing arguments."""
+    return [find_blender(), '--background', '--factory-startup',
+            '--threads', str(_blender_threads()), *args]
+
+
 def run_blender_script(script, timeout=300, capture_output=True):
     """
     Run a Python script in Blender's background mode.
@@ -84,26 +166,122 @@ def run_blender_script(script, timeout=300, capture_output=True):
         capture_output: Whether to capture stdout/stderr (default: True)
 
     Returns:
-        subprocess.CompletedProcess: Result of the subprocess call
+        subprocess.CompletedProcess: Result of the subprocess call (stdout and
+            stderr hold only the last _LOG_TAIL_LINES lines of each)
 
     Raises:
         RuntimeError: If Blender execution fails
     """
-    blender_path = find_blender()
+    return _run_blender_process(
+        _blender_command('--python-expr', script), timeout, capture_output
+    )
+
+
+def run_blender_script_file(script_path, script_args=(), timeout=300, capture_output=True):
+    """
+    Run a Python script file in Blender's background mode.
+
+    Arguments are passed after '--' so Blender ignores them and the script
+    can read them from sys.argv.
+
+    Args:
+        script_path: Path to the script file to execute in Blender
+        script_args: Sequence of arguments passed to the script
+        timeout: Maximum execution time in seconds (default: 300)
+        capture_output: Whether to capture stdout/stderr (default: True)
 
-    result = subprocess.run(
-        [blender_path, '--background', '--python-expr', script],
-        capture_output=capture_output,
+    Returns:
+        subprocess.CompletedProcess: Result of the subprocess call (stdout and
+            stderr hold only the last _LOG_TAIL_LINES lines of each)
+
+    Raises:
+        RuntimeError: If Blender execution fails
+    """
+    return _run_blender_process(
+        _blender_command('--python', str(script_path), '--', *[str(arg) for arg in script_args]),
+        timeout, capture_output
+    )
+
+
+def _run_blender_process(cmd, timeout, capture_output):
+    """
+    Run a Blender command to completion, keeping only the tail of its output.
+
+    Blender can log tens of MB on large jobs; subprocess.run would hold all
+    of it until exit. Here reader threads drain stdout and stderr line by
+    line into bounded deques, so memory stays constant and the pipes never
+    fill up and stall Blender.
+    """
+    if not capture_output:
+        proc = subprocess.Popen(cmd)
+        _wait_interruptible(proc, timeout)
+        if proc.returncode != 0:
+            raise RuntimeError(f"Blender execution failed with exit code {proc.returncode}")
+        return subprocess.CompletedProcess(cmd, proc.returncode)
+
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         text=True,
-        timeout=timeout
+        bufsize=1
     )
+    stdout_tail = collections.deque(maxlen=_LOG_TAIL_LINES)
+    stderr_tail = collections.deque(maxlen=_LOG_TAIL_LINES)
+    readers = [
+        threading.Thread(target=stdout_tail.extend, args=(proc.stdout,), daemon=True),
+        threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        _wait_interruptible(proc, timeout)
+    finally:
+        for reader in readers:
+            reader.join()
 
+    result = subprocess.CompletedProcess(
+        cmd, proc.returncode, ''.join(stdout_tail), ''.join(stderr_tail)
+    )
     if result.returncode != 0:
         raise RuntimeError(f"Blender execution failed: {result.stderr}")
 
     return result
 
 
+def _wait_interruptible(proc, timeout):
+    """
+    Wait for a Blender process, killing it on timeout or a ComfyUI interrupt.
+
+    Raises:
+        subprocess.TimeoutExpired: If the process outlives timeout
+        comfy.model_management.InterruptProcessingException: If the user
+            cancelled the prompt (only when running inside ComfyUI)
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            proc.wait(timeout=min(_INTERRUPT_POLL_SECONDS, max(deadline - time.monotonic(), 0)))
+            return
+        except subprocess.TimeoutExpired:
+            pass
+        if _interrupt_requested():
+            proc.kill()
+            proc.wait()
+            print("[Blender] Prompt interrupted, stopped Blender")
+            model_management.throw_exception_if_processing_interrupted()
+        if time.monotonic() >= deadline:
+            proc.kill()
+            proc.wait()
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+
+
+def _interrupt_requested():
+    """Whether ComfyUI's interrupt (cancel) flag is set."""
+    return INTERRUPT_AVAILABLE and model_management.processing_interrupted()
+
+
 def run_blender_mesh_operation(input_mesh, blender_script_template,
                                 output_format='obj', timeout=300,
                                 preserve_metadata=True, metadata_key='blender_operation',
@@ -113,7 +291,8 @@ def run_blender_mesh_operation(input_mesh, blender_script_template,
 
     Args:
         input_mesh: Input trimesh.Trimesh object
-        blender_script_template: Script template with {input_path} and {output_path} placeholders
+        blender_script_template: Script template with {input_path!r} and {output_path!r}
+            placeholders (use !r so the paths become quoted, escaped literals)
         output_format: Output file format ('obj', 'ply', etc.)
         timeout: Maximum execution time in seconds
         preserve_metadata: Whether to copy metadata from input to output
@@ -126,59 +305,424 @@ def run_blender_mesh_operation(input_mesh, blender_script_template,
     Raises:
         RuntimeError: If operation fails
     """
-    # Create temp files
-    with tempfile.NamedTemporaryFile(suffix='.obj', delete=False) as f_in:
-        input_path = f_in.name
-        input_mesh.export(input_path)
-
-    with tempfile.NamedTemporaryFile(suffix=f'.{output_format}', delete=False) as f_out:
-        output_path = f_out.name
-
-    try:
+    def run(input_path, output_path):
         # Format the script with file paths
         script = blender_script_template.format(
             input_path=input_path,
             output_path=output_path
         )
-
-        # Run Blender
         run_blender_script(script, timeout=timeout)
 
-        # Load the result
-        result_mesh = trimesh_module.load(output_path, process=False)
+    return _run_mesh_job(
+        input_mesh, run, output_format,
+        preserve_metadata, metadata_key, metadata_values
+    )
 
-        # Handle Scene objects
-        if isinstance(result_mesh, trimesh_module.Scene):
-            result_mesh = result_mesh.dump(concatenate=True)
 
-        # Preserve metadata
-        if preserve_metadata:
-            result_mesh.metadata = input_mesh.metadata.copy()
+def run_blender_mesh_script(input_mesh, script_name, script_args=(),
+                            timeout=300, preserve_metadata=True,
+                            metadata_key='blender_operation', metadata_values=None,
+                            persistent=True):
+    """
+    Execute one of the static scripts in blender_scripts/ on a mesh.
 
-        # Add operation metadata
-        if metadata_values:
-            result_mesh.metadata[metadata_key] = metadata_values
+    The mesh travels both ways in the raw stream format (see write_mesh_stream).
+    On POSIX both paths are named pipes, so the input is pushed while Blender
+    is busy and no mesh bytes touch the filesystem; elsewhere they are plain
+    temp files. The script is invoked as:
+        <script> -- --in <input_path> --out <output_path> *script_args
 
-        return result_mesh
+    Args:
+        input_mesh: Input trimesh.Trimesh object
+        script_name: File name of the script inside BLENDER_SCRIPTS_DIR
+        script_args: Extra flags appended after the input/output paths,
+            e.g. ['--voxel-size', '0.02']
+        timeout: Maximum execution time in seconds
+        preserve_metadata: Whether to copy metadata from input to output
+        metadata_key: Key to store operation metadata under
+        metadata_values: Dictionary of metadata to store
+        persistent: Run the job in the shared BlenderWorker instead of
+            starting a fresh Blender process (a fresh one is still used
+            while the worker is busy with another job)
 
+    Returns:
+        trimesh.Trimesh: Resulting mesh after Blender operation
+
+    Raises:
+        RuntimeError: If operation fails
+    """
+    script_path = BLENDER_SCRIPTS_DIR / script_name
+
+    try:
+        vertices, faces = _run_mesh_script_job(input_mesh, script_path, script_args,
+                                               timeout, persistent)
+    except BlenderWorkerCrashed:
+        # The worker restarts on its next job; this one is replayed from scratch
+        print(f"[Blender] Persistent worker crashed, retrying {script_name} in a one-shot Blender process")
+        vertices, faces = _run_mesh_script_job(input_mesh, script_path, script_args,
+                                               timeout, persistent=False)
+
+    result_mesh = trimesh_module.Trimesh(vertices=vertices, faces=faces, process=False)
+    return _apply_metadata(result_mesh, input_mesh,
+                           preserve_metadata, metadata_key, metadata_values)
+
+
+def _run_mesh_script_job(input_mesh, script_path, script_args, timeout, persistent):
+    """
+    Stream input_mesh through one run of script_path.
+
+    Returns:
+        tuple: (vertices, faces) arrays read back from the script
+    """
+    estimated_bytes = input_mesh.vertices.nbytes + input_mesh.faces.nbytes
+    with tempfile.TemporaryDirectory(prefix='geompack_blender_',
+                                     dir=_temp_root(estimated_bytes)) as tmp_dir:
+        input_path = os.path.join(tmp_dir, 'input.mesh')
+        output_path = os.path.join(tmp_dir, 'output.mesh')
+        args = ['--in', input_path, '--out', output_path, *script_args]
+
+        def run():
+            # While the shared worker is busy with another thread's job, this
+            # one gets its own Blender instead of queueing behind it
+            if not (persistent and _worker.run_script(script_path, args,
+                                                      timeout=timeout, wait=False)):
+                run_blender_script_file(script_path, args, timeout=timeout)
+
+        if hasattr(os, 'mkfifo'):
+            return _exchange_via_fifos(input_mesh, input_path, output_path, run)
+
+        with open(input_path, 'wb') as f:
+            write_mesh_stream(f, input_mesh)
+        run()
+        with open(output_path, 'rb') as f:
+            return read_mesh_stream(f)
+
+
+def _exchange_via_fifos(input_mesh, input_path, output_path, run):
+    """
+    Create input_path/output_path as named pipes and call run() while they are served.
+
+    A writer thread feeds the input pipe and a reader thread drains the output
+    pipe while run() blocks on Blender. If Blender finishes without opening a
+    pipe, the thread blocked on it is released by opening the other end.
+
+    Returns:
+        tuple: (vertices, faces) read from the output pipe
+    """
+    os.mkfifo(input_path)
+    os.mkfifo(output_path)
+
+    result = {}
+
+    def feed():
+        try:
+            with open(input_path, 'wb') as f:
+                write_mesh_stream(f, input_mesh)
+        except BrokenPipeError:
+            pass  # Blender stopped reading; run() reports why
+
+    def drain():
+        try:
+            with open(output_path, 'rb') as f:
+                result['arrays'] = read_mesh_stream(f)
+        except EOFError as e:
+            result['error'] = e
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    drainer = threading.Thread(target=drain, daemon=True)
+    feeder.start()
+    drainer.start()
+
+    try:
+        run()
     finally:
-        # Cleanup temp files
-        cleanup_temp_files([input_path, output_path])
+        _release_fifo(feeder, input_path, os.O_RDONLY)
+        _release_fifo(drainer, output_path, os.O_WRONLY)
+
+    if 'arrays' not in result:
+        raise RuntimeError(f"Blender produced no mesh output: {result.get('error')}")
+    return result['arrays']
+
+
+def _release_fifo(thread, path, flags):
+    """Unblock a thread stuck opening a FIFO whose peer (Blender) is done with it."""
+    for _ in range(100):
+        if not thread.is_alive():
+            return
+        try:
+            os.close(os.open(path, flags | os.O_NONBLOCK))
+        except OSError:
+            pass
+        thread.join(0.05)
+
+
+class BlenderWorkerCrashed(RuntimeError):
+    """The persistent Blender worker exited before answering a job."""
+
+
+class BlenderWorker:
+    """
+    Long-lived Blender process that runs blender_scripts/ jobs on request.
+
+    Starting Blender costs seconds before any mesh work happens, which dominates
+    repeated calls on small meshes. The worker is started lazily on the first
+    job, runs blender_scripts/worker.py, and receives one JSON line per job on
+    stdin. Replies come back on stdout behind a marker so they can be told apart
+    from Blender's own log output. A worker that died is restarted on the next job;
+    run_blender_mesh_script replays the job that crashed it in a one-shot process.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._lines = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        cmd = _blender_command('--python', str(BLENDER_SCRIPTS_DIR / 'worker.py'))
+        print("[Blender] Starting persistent Blender worker")
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._pump, args=(self._proc.stdout, self._lines), daemon=True
+        ).start()
+
+    @staticmethod
+    def _pump(stream, lines):
+        """Forward worker output lines to a queue so reads can time out."""
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def run_script(self, script_path, script_args=(), timeout=300, wait=True):
+        """
+        Run a script file in the worker, as run_blender_script_file would.
+
+        Args:
+            wait: If False and the worker is busy with another job, return
+                False at once instead of queueing behind it
+
+        Returns:
+            bool: True once the job has run; False if skipped (see wait)
+
+        Raises:
+            RuntimeError: If the script fails
+            BlenderWorkerCrashed: If the worker exits before replying
+            subprocess.TimeoutExpired: If no reply arrives within timeout;
+                the worker is killed and restarted on the next job
+            comfy.model_management.InterruptProcessingException: If the
+                prompt is interrupted meanwhile (the worker is killed too)
+        """
+        request = json.dumps({
+            'script': str(script_path),
+            'args': [str(arg) for arg in script_args]
+        })
+        if not self._lock.acquire(blocking=wait):
+            return False
+        try:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            proc = self._proc
+
+            log = collections.deque(maxlen=_LOG_TAIL_LINES)
+            try:
+                proc.stdin.write(request + '\n')
+                proc.stdin.flush()
+            except OSError:
+                self._proc = None
+                raise BlenderWorkerCrashed("Blender worker exited unexpectedly")
+
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    line = self._lines.get(
+                        timeout=min(_INTERRUPT_POLL_SECONDS, max(deadline - time.monotonic(), 0))
+                    )
+                except queue.Empty:
+                    if _interrupt_requested():
+                        # The job cannot be aborted inside Blender; drop the worker
+                        self._kill()
+                        print("[Blender] Prompt interrupted, stopped Blender worker")
+                        model_management.throw_exception_if_processing_interrupted()
+                    if time.monotonic() >= deadline:
+                        self._kill()
+                        raise subprocess.TimeoutExpired(proc.args, timeout)
+                    continue
+                if line is None:
+                    self._proc = None
+                    raise BlenderWorkerCrashed(
+                        "Blender worker exited unexpectedly:\n" + ''.join(log)
+                    )
+                marker = line.find(_WORKER_REPLY_MARKER)
+                if marker < 0:
+                    log.append(line)
+                    continue
+                reply = json.loads(line[marker + len(_WORKER_REPLY_MARKER):])
+                if not reply['ok']:
+                    raise RuntimeError(f"Blender execution failed: {reply['error']}")
+                return True
+        finally:
+            self._lock.release()
+
+    def _kill(self):
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+    def close(self):
+        """Ask the worker to quit, killing it if it does not exit promptly."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+            if proc is None or proc.poll() is not None:
+                return
+            try:
+                proc.stdin.write(json.dumps({'op': 'quit'}) + '\n')
+                proc.stdin.flush()
+                proc.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                proc.kill()
+                proc.wait()
+
+
+# Must match REPLY_MARKER in blender_scripts/worker.py
+_WORKER_REPLY_MARKER = '@@geompack-worker@@ '
+
+# Shared worker used by run_blender_mesh_script, stopped at interpreter exit
+_worker = BlenderWorker()
+atexit.register(_worker.close)
 
 
-def cleanup_temp_files(file_paths):
+def _run_mesh_job(input_mesh, run, output_format,
+                  preserve_metadata, metadata_key, metadata_values):
+    """Export the input mesh as OBJ, call run(input_path, output_path), load the result."""
+    # Input and output share one temp directory, removed in a single rmtree
+    estimated_bytes = input_mesh.vertices.nbytes + input_mesh.faces.nbytes
+    with tempfile.TemporaryDirectory(prefix='geompack_blender_',
+                                     dir=_temp_root(estimated_bytes)) as tmp_dir:
+        input_path = os.path.join(tmp_dir, 'input.obj')
+        output_path = os.path.join(tmp_dir, f'output.{output_format}')
+
+        input_mesh.export(input_path)
+
+        # Run Blender
+        run(input_path, output_path)
+
+        result_mesh = load_exported_mesh(output_path, output_format)
+
+    return _apply_metadata(result_mesh, input_mesh,
+                           preserve_metadata, metadata_key, metadata_values)
+
+
+def load_exported_mesh(path, file_type):
     """
-    Clean up temporary files.
+    Load a single-object Blender export directly as a Trimesh.
+
+    Blender scripts export exactly one selected object, so the format loader's
+    output is turned into a Trimesh without trimesh.load()'s Scene assembly
+    and dump/concatenate pass. Exports that unexpectedly hold several objects
+    fall back to the generic loader.
 
     Args:
-        file_paths: List of file paths to remove
+        path: Path of the exported file
+        file_type: Format of the file ('obj', 'ply', ...)
+
+    Returns:
+        trimesh.Trimesh: Loaded mesh (not processed)
     """
-    for path in file_paths:
-        if path and os.path.exists(path):
-            try:
-                os.unlink(path)
-            except Exception as e:
-                print(f"[Blender] Warning: Could not remove temp file {path}: {e}")
+    loader = trimesh_module.exchange.load.mesh_loaders.get(file_type)
+    if loader is not None:
+        with open(path, 'rb') as f:
+            kwargs = loader(f, file_type=file_type)
+        # Some loaders (e.g. OBJ) wrap their result in a one-entry geometry dict
+        geometry = kwargs.get('geometry')
+        if geometry is None:
+            return trimesh_module.Trimesh(**kwargs, process=False)
+        if len(geometry) == 1:
+            return trimesh_module.Trimesh(**next(iter(geometry.values())), process=False)
+
+    return trimesh_module.load(path, file_type=file_type, process=False, force='mesh')
+
+
+def _apply_metadata(result_mesh, input_mesh, preserve_metadata, metadata_key, metadata_values):
+    """Carry metadata over from the input mesh and record the operation."""
+    # Preserve metadata
+    if preserve_metadata:
+        result_mesh.metadata = input_mesh.metadata.copy()
+
+    # Add operation metadata
+    if metadata_values:
+        result_mesh.metadata[metadata_key] = metadata_values
+
+    return result_mesh
+
+
+def _temp_root(estimated_bytes):
+    """
+    Pick the parent directory for Blender I/O temp files.
+
+    Prefers the RAM-backed /dev/shm when it is writable and has comfortable
+    headroom (containers often cap it at 64 MB), otherwise the system temp dir.
+    """
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        try:
+            if shutil.disk_usage(_SHM_DIR).free > 8 * estimated_bytes:
+                return _SHM_DIR
+        except OSError:
+            pass
+    return tempfile.gettempdir()
+
+
+def write_mesh_stream(f, mesh):
+    """
+    Write mesh vertices/faces in the raw stream format read by blender_scripts/_mesh_io.py.
+
+    Layout: int64 vertex count, int64 face count, float32 vertices, int32 faces,
+    all little-endian. These are Blender's native dtypes, so the arrays can be
+    handed straight to foreach_set() on the other side.
+
+    Args:
+        f: Binary file object (regular file or FIFO)
+        mesh: trimesh.Trimesh to write
+    """
+    vertices = np.ascontiguousarray(mesh.vertices, dtype='<f4')
+    faces = np.ascontiguousarray(mesh.faces, dtype='<i4')
+    f.write(np.array([len(vertices), len(faces)], dtype='<i8').tobytes())
+    for array in (vertices, faces):
+        if array.size:  # memoryview cannot cast empty shapes
+            f.write(memoryview(array).cast('B'))
+
+
+def read_mesh_stream(f):
+    """
+    Read a mesh written in the raw stream format.
+
+    Returns:
+        tuple: (vertices (N, 3) float32, faces (M, 3) int32), both writable
+    """
+    n_v, n_f = np.frombuffer(_read_exact(f, 16), dtype='<i8')
+    vertices = np.frombuffer(_read_exact(f, 12 * int(n_v)), dtype='<f4').reshape(-1, 3)
+    faces = np.frombuffer(_read_exact(f, 12 * int(n_f)), dtype='<i4').reshape(-1, 3)
+    return vertices, faces
+
+
+def _read_exact(f, nbytes):
+    """Read exactly nbytes into a writable buffer (pipes may return short reads)."""
+    buf = bytearray(nbytes)
+    view = memoryview(buf)
+    pos = 0
+    while pos < nbytes:
+        n = f.readinto(view[pos:])
+        if not n:
+            raise EOFError(f"Mesh stream truncated ({pos} of {nbytes} bytes)")
+        pos += n
+    return buf
 
 
 # Common Blender script templates
@@ -190,7 +734,7 @@ bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete()
 
 # Import mesh
-bpy.ops.wm.obj_import(filepath='{input_path}')
+bpy.ops.wm.obj_import(filepath={input_path!r})
 
 # Get imported object
 obj = bpy.context.selected_objects[0]
@@ -200,7 +744,7 @@ bpy.context.view_layer.objects.active = obj
 BLENDER_EXPORT_OBJ = """
 # Export result
 bpy.ops.wm.obj_export(
-    filepath='{output_path}',
+    filepath={output_path!r},
     export_selected_objects=True,
     export_uv=False,
     export_materials=False
@@ -210,7 +754,7 @@ bpy.ops.wm.obj_export(
 BLENDER_EXPORT_OBJ_WITH_UV = """
 # Export result with UVs
 bpy.ops.wm.obj_export(
-    filepath='{output_path}',
+    filepath={output_path!r},
     export_selected_objects=True,
     export_uv=True,
     export_materials=False
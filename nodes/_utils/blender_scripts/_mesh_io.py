@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 ComfyUI-GeometryPack Contributors
+
+"""
+Mesh I/O helpers shared by the scripts in this directory.
+
+These run inside Blender's bundled Python (bpy + numpy), not in ComfyUI.
+"""
+
+import argparse
+import sys
+
+import bpy
+import numpy as np
+
+
+def script_args():
+    """Return the arguments passed to the script after '--'."""
+    argv = sys.argv
+    return argv[argv.index('--') + 1:] if '--' in argv else []
+
+
+def mesh_job_parser(description):
+    """Argument parser with the --in/--out stream paths every mesh script takes."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--in', dest='input_path', required=True)
+    parser.add_argument('--out', dest='output_path', required=True)
+    return parser
+
+
+def _build_bpy_mesh(verts, faces, name="mesh"):
+    """Build a bpy mesh by preallocating and bulk-filling it with foreach_set."""
+    n_v = len(verts)
+    n_f = len(faces)
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(n_v)
+    mesh.vertices.foreach_set("co", verts.ravel())
+    mesh.loops.add(3 * n_f)
+    mesh.loops.foreach_set("vertex_index", faces.ravel())
+    mesh.polygons.add(n_f)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, 3 * n_f, 3, dtype=np.int32))
+    try:
+        # Blender < 4.0 needs explicit loop counts; newer versions derive them
+        mesh.polygons.foreach_set("loop_total", np.full(n_f, 3, dtype=np.int32))
+    except (AttributeError, TypeError, RuntimeError):
+        pass
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def _read_exact(f, nbytes):
+    """Read exactly nbytes into a writable buffer (pipes may return short reads)."""
+    buf = bytearray(nbytes)
+    view = memoryview(buf)
+    pos = 0
+    while pos < nbytes:
+        n = f.readinto(view[pos:])
+        if not n:
+            raise EOFError(f"Mesh stream truncated ({pos} of {nbytes} bytes)")
+        pos += n
+    return buf
+
+
+def import_mesh_stream(input_path):
+    """
+    Clear the scene and load the mesh stream written by blender_bridge.write_mesh_stream.
+
+    input_path may be a regular file or a FIFO; it is read front to back once.
+
+    Returns:
+        The new object, selected and set as active.
+    """
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+
+    with open(input_path, 'rb') as f:
+        n_v, n_f = np.frombuffer(_read_exact(f, 16), dtype='<i8')
+        verts = np.frombuffer(_read_exact(f, 12 * int(n_v)), dtype='<f4')
+        faces = np.frombuffer(_read_exact(f, 12 * int(n_f)), dtype='<i4')
+
+    obj = bpy.data.objects.new("mesh", _build_bpy_mesh(verts, faces))
+    bpy.context.collection.objects.link(obj)
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+    return obj
+
+
+def export_mesh_stream(obj, output_path):
+    """
+    Write obj's geometry back in the mesh stream format.
+
+    Polygons are triangulated through the loop-triangle cache and both arrays
+    are pulled out with foreach_get, so no exporter or per-element loop is involved.
+    """
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+
+    verts = np.empty(3 * len(mesh.vertices), dtype='<f4')
+    mesh.vertices.foreach_get("co", verts)
+    faces = np.empty(3 * len(mesh.loop_triangles), dtype='<i4')
+    mesh.loop_triangles.foreach_get("vertices", faces)
+
+    with open(output_path, 'wb') as f:
+        f.write(np.array([len(mesh.vertices), len(mesh.loop_triangles)], dtype='<i8').tobytes())
+        f.write(verts.tobytes())
+        f.write(faces.tobytes())
@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 ComfyUI-GeometryPack Contributors
+
+"""
+Blender Quadriflow remesh.
+
+Usage (inside Blender):
+    blender --background --python quadriflow_remesh.py -- --in <input> --out <output> --target-faces <count>
+"""
+
+import os
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _mesh_io import script_args, mesh_job_parser, import_mesh_stream, export_mesh_stream
+
+parser = mesh_job_parser("Blender Quadriflow remesh")
+parser.add_argument('--target-faces', type=int, required=True)
+args = parser.parse_args(script_args())
+
+obj = import_mesh_stream(args.input_path)
+
+# Apply Quadriflow remesh
+bpy.ops.object.quadriflow_remesh(
+    use_mesh_symmetry=False,
+    use_preserve_sharp=False,
+    use_preserve_boundary=False,
+    smooth_normals=False,
+    mode='FACES',
+    target_faces=args.target_faces,
+    seed=0
+)
+
+export_mesh_stream(obj, args.output_path)
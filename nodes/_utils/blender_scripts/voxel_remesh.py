@@ -0,0 +1,29 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 ComfyUI-GeometryPack Contributors
+
+"""
+Blender voxel remesh.
+
+Usage (inside Blender):
+    blender --background --python voxel_remesh.py -- --in <input> --out <output> --voxel-size <size>
+"""
+
+import os
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _mesh_io import script_args, mesh_job_parser, import_mesh_stream, export_mesh_stream
+
+parser = mesh_job_parser("Blender voxel remesh")
+parser.add_argument('--voxel-size', type=float, required=True)
+args = parser.parse_args(script_args())
+
+obj = import_mesh_stream(args.input_path)
+
+# Apply voxel remesh
+obj.data.remesh_voxel_size = args.voxel_size
+bpy.ops.object.voxel_remesh()
+
+export_mesh_stream(obj, args.output_path)
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 ComfyUI-GeometryPack Contributors
+
+"""
+Persistent job loop for blender_bridge.BlenderWorker.
+
+Reads one JSON request per line from stdin:
+    {"script": "<path>", "args": [...]}   run a script as if invoked with -- args
+    {"op": "quit"}                        leave the loop (Blender then exits)
+and answers each job with one line on stdout:
+    @@geompack-worker@@ {"ok": true} | {"ok": false, "error": "<traceback>"}
+
+Usage (inside Blender):
+    blender --background --python worker.py
+"""
+
+import json
+import os
+import runpy
+import sys
+import traceback
+
+import bpy
+
+# Must match _WORKER_REPLY_MARKER in blender_bridge.py
+REPLY_MARKER = '@@geompack-worker@@ '
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def _purge_orphans():
+    """Free mesh datablocks left behind by the previous job."""
+    for mesh in list(bpy.data.meshes):
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def _reply(**payload):
+    sys.stdout.write(REPLY_MARKER + json.dumps(payload) + '\n')
+    sys.stdout.flush()
+
+
+for line in sys.stdin:
+    request = json.loads(line)
+    if request.get('op') == 'quit':
+        break
+
+    try:
+        sys.argv = ['blender', '--', *request['args']]
+        runpy.run_path(request['script'], run_name='__main__')
+    except BaseException:
+        _reply(ok=False, error=traceback.format_exc())
+    else:
+        _reply(ok=True)
+    finally:
+        _purge_orphans()
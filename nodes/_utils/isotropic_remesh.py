@@ -0,0 +1,416 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 ComfyUI-GeometryPack Contributors
+
+"""
+In-process isotropic remeshing on plain numpy arrays.
+
+Implements the split / collapse / flip / relax loop of Botsch & Kobbelt
+("A Remeshing Approach to Multiresolution Modeling", 2004) without leaving
+Python or copying the mesh into a native library. Instead of walking a
+half-edge structure one edge at a time, each pass selects an independent
+set of edges (no two touching the same faces) and applies all of them with
+array operations, repeating while the rounds still make progress.
+
+Boundary and non-manifold vertices are kept fixed, as are vertices on
+feature edges (dihedral angle above feature_angle), so borders and creases
+survive the remesh.
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+import trimesh as trimesh_module
+
+
+# Upper bound on independent-set rounds per split/collapse pass
+_MAX_ROUNDS = 64
+
+# A collapse round touching fewer than 1 / _MIN_PROGRESS of the faces ends the pass
+_MIN_PROGRESS = 200
+
+
+def isotropic_remesh(vertices, faces, target_edge_length, iterations=3,
+                     feature_angle=45.0, protect_boundaries=True, project=True):
+    """
+    Remesh a triangle mesh towards uniform edge length.
+
+    Args:
+        vertices: (N, 3) vertex positions
+        faces: (M, 3) triangle indices (vertices should be welded)
+        target_edge_length: Desired edge length, in mesh units
+        iterations: Number of split/collapse/flip/relax passes
+        feature_angle: Dihedral angle in degrees above which edges are
+            treated as creases and left in place
+        protect_boundaries: Do not split boundary edges either, keeping
+            the border exactly as in the input (as CGAL's protect_constraints,
+            this also leaves the faces on over-long border edges unrefined)
+        project: Project relaxed vertices back onto the input surface
+
+    Returns:
+        tuple: (vertices (K, 3) float64, faces (L, 3) int64)
+    """
+    V = np.array(vertices, dtype=np.float64).reshape(-1, 3)
+    F = np.array(faces, dtype=np.int64).reshape(-1, 3)
+    if len(F) == 0:
+        return np.empty((0, 3), dtype=np.float64), F
+
+    high = 4.0 / 3.0 * target_edge_length
+    low = 4.0 / 5.0 * target_edge_length
+    cos_feature = np.cos(np.radians(feature_angle))
+
+    reference = _SurfaceProjector(V, F) if project else None
+    # Fixed seed: independent-set tie-breaking is random but results repeat
+    rng = np.random.default_rng(0)
+
+    for _ in range(iterations):
+        for _ in range(_MAX_ROUNDS):
+            V, F, n_split = _split_long_edges(V, F, high, protect_boundaries)
+            if n_split == 0:
+                break
+        for _ in range(_MAX_ROUNDS):
+            V, F, n_collapsed = _collapse_short_edges(V, F, low, high, cos_feature, rng)
+            # Late rounds only pick off edges blocked by their neighbours;
+            # leave those to the next iteration instead of rebuilding topology
+            if n_collapsed * _MIN_PROGRESS < len(F):
+                break
+        F = _flip_edges(V, F, cos_feature, rng)
+        V = _tangential_relax(V, F, cos_feature, reference)
+        V, F = _compact(V, F)
+
+    return V, F
+
+
+class _Topology:
+    """Edge table of a triangle mesh, rebuilt from the face array on demand."""
+
+    def __init__(self, V, F):
+        n = len(V)
+        he_from = F.ravel()
+        he_to = F[:, [1, 2, 0]].ravel()
+        lo = np.minimum(he_from, he_to)
+        hi = np.maximum(he_from, he_to)
+
+        keys, he_edge, counts = np.unique(lo * n + hi, return_inverse=True, return_counts=True)
+        self.n = n
+        self.keys = keys
+        self.edges = np.stack([keys // n, keys % n], axis=1)
+        self.he_edge = he_edge.ravel()
+        self.counts = counts
+
+        # First and (for two-sided edges) second half-edge of every edge
+        order = np.argsort(self.he_edge, kind='stable')
+        starts = np.cumsum(counts) - counts
+        self.he0 = order[starts]
+        self.he1 = np.where(counts >= 2, order[np.minimum(starts + 1, len(order) - 1)], -1)
+
+        # Vertices on a border or non-manifold edge never move or collapse
+        irregular = self.edges[counts != 2].ravel()
+        self.locked = np.zeros(n, dtype=bool)
+        self.locked[irregular] = True
+
+        self.degree = np.bincount(self.edges.ravel(), minlength=n)
+
+    def neighbours(self):
+        """CSR-style (offsets, indices) listing each vertex's neighbours."""
+        e = self.edges
+        src = np.concatenate([e[:, 0], e[:, 1]])
+        dst = np.concatenate([e[:, 1], e[:, 0]])
+        order = np.argsort(src, kind='stable')
+        offsets = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(self.degree, out=offsets[1:])
+        return offsets, dst[order]
+
+    def has_edge(self, a, b):
+        key = np.minimum(a, b) * self.n + np.maximum(a, b)
+        pos = np.minimum(np.searchsorted(self.keys, key), len(self.keys) - 1)
+        return self.keys[pos] == key
+
+
+class _SurfaceProjector:
+    """
+    Approximate closest-point projection onto the input surface.
+
+    Finds the nearest input vertex with a KD-tree and takes the exact closest
+    point over the triangles around it. Relaxed vertices move only a fraction
+    of an edge, so the true closest triangle is practically always in that
+    fan, and the query avoids a full triangle BVH search.
+    """
+
+    def __init__(self, V, F):
+        self.triangles = V[F]
+        self.tree = cKDTree(V)
+        mesh = trimesh_module.Trimesh(vertices=V, faces=F, process=False)
+        self.vertex_faces = np.asarray(mesh.vertex_faces)
+
+    def project(self, points):
+        _, nearest = self.tree.query(points)
+        fan = self.vertex_faces[nearest]
+        query, slot = np.nonzero(fan >= 0)
+        face = fan[query, slot]
+
+        closest = trimesh_module.triangles.closest_point(self.triangles[face], points[query])
+        dist = np.einsum('ij,ij->i', closest - points[query], closest - points[query])
+
+        # Keep the nearest candidate per query point
+        order = np.lexsort((dist, query))
+        first = order[np.r_[True, query[order][1:] != query[order][:-1]]]
+        projected = points.copy()
+        projected[query[first]] = closest[first]
+        return projected
+
+
+def _face_normals(V, F):
+    """Unit face normals (zero for degenerate faces)."""
+    tri = V[F]
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    norms = np.linalg.norm(normals, axis=1, keepdims=True)
+    return np.divide(normals, norms, out=np.zeros_like(normals), where=norms > 0)
+
+
+def _feature_vertices(topo, face_normals, cos_feature):
+    """Mask of vertices lying on a crease (two-sided edge with a sharp dihedral)."""
+    two_sided = topo.counts == 2
+    f0 = topo.he0[two_sided] // 3
+    f1 = topo.he1[two_sided] // 3
+    sharp = np.einsum('ij,ij->i', face_normals[f0], face_normals[f1]) < cos_feature
+    mask = np.zeros(topo.n, dtype=bool)
+    mask[topo.edges[two_sided][sharp].ravel()] = True
+    return mask
+
+
+def _unique_priority(values, mask, rng):
+    """
+    Rank masked entries by value; unmasked entries get INT max.
+
+    Ties are broken randomly rather than by index: on a uniform mesh nearly
+    all candidates tie, and index order would chain them so that only a
+    handful win their neighbourhood per round.
+    """
+    prio = np.full(len(values), np.iinfo(np.int64).max, dtype=np.int64)
+    idx = np.flatnonzero(mask)
+    order = np.lexsort((rng.random(len(idx)), values[idx]))
+    prio[idx[order]] = np.arange(len(idx))
+    return prio
+
+
+def _split_long_edges(V, F, high, protect_boundaries):
+    """Split an independent set of edges longer than high at their midpoints."""
+    topo = _Topology(V, F)
+    edges = topo.edges
+    length = np.linalg.norm(V[edges[:, 0]] - V[edges[:, 1]], axis=1)
+    long_edge = length > high
+    candidate = long_edge.copy()
+    if protect_boundaries:
+        # A face holding a protected over-long edge keeps it whatever we do,
+        # and splitting its other edges would only fan slivers out of it, so
+        # those edges are frozen too. Only the faces on the border itself:
+        # the interior beyond them is refined as usual.
+        protected = long_edge & (topo.counts != 2)
+        stuck = protected[topo.he_edge].reshape(-1, 3).any(axis=1)
+        frozen = np.zeros(len(edges), dtype=bool)
+        frozen[topo.he_edge[np.repeat(stuck, 3)]] = True
+        candidate &= ~frozen
+    if not candidate.any():
+        return V, F, 0
+
+    # Every face picks its longest candidate edge; an edge is split when all
+    # of its faces picked it, so each face is split along at most one edge
+    he_len = np.where(candidate[topo.he_edge], length[topo.he_edge], -1.0).reshape(-1, 3)
+    choice = np.argmax(he_len, axis=1)
+    chosen = np.zeros(he_len.shape, dtype=bool)
+    chosen[np.arange(len(F)), choice] = he_len[np.arange(len(F)), choice] > 0
+    chosen = chosen.ravel()
+
+    votes = np.bincount(topo.he_edge[chosen], minlength=len(edges))
+    split = candidate & (votes == topo.counts)
+    if not split.any():
+        return V, F, 0
+
+    split_edges = np.flatnonzero(split)
+    midpoint_index = np.full(len(edges), -1, dtype=np.int64)
+    midpoint_index[split_edges] = len(V) + np.arange(len(split_edges))
+    V = np.concatenate([V, V[edges[split_edges]].mean(axis=1)])
+
+    # Face (a, b, c) split along a->b becomes (a, m, c) + (m, b, c)
+    he = np.flatnonzero(chosen & split[topo.he_edge])
+    f, k = he // 3, he % 3
+    a, b, c = F[f, k], F[f, (k + 1) % 3], F[f, (k + 2) % 3]
+    m = midpoint_index[topo.he_edge[he]]
+
+    F = F.copy()
+    F[f] = np.stack([a, m, c], axis=1)
+    F = np.concatenate([F, np.stack([m, b, c], axis=1)])
+    return V, F, len(split_edges)
+
+
+def _collapse_short_edges(V, F, low, high, cos_feature, rng):
+    """Collapse an independent set of edges shorter than low into their midpoints."""
+    topo = _Topology(V, F)
+    edges = topo.edges
+    a, b = edges[:, 0], edges[:, 1]
+    length = np.linalg.norm(V[a] - V[b], axis=1)
+
+    face_normals = _face_normals(V, F)
+    fixed = topo.locked | _feature_vertices(topo, face_normals, cos_feature)
+    candidate = (length < low) & (topo.counts == 2) & ~fixed[a] & ~fixed[b]
+    if not candidate.any():
+        return V, F, 0
+
+    # Keep only edges whose closed 2-ring holds no shorter candidate, so the
+    # accepted collapses touch disjoint sets of faces (lengths within 10% of
+    # low count as equal so random tie-breaking keeps the set large)
+    prio = _unique_priority(np.floor(length / (0.1 * low)), candidate, rng)
+    vmin = np.full(topo.n, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(vmin, a[candidate], prio[candidate])
+    np.minimum.at(vmin, b[candidate], prio[candidate])
+    vmin2 = vmin.copy()
+    np.minimum.at(vmin2, a, vmin[b])
+    np.minimum.at(vmin2, b, vmin[a])
+    accept = candidate & (prio == np.minimum(vmin2[a], vmin2[b]))
+
+    # Link condition: exactly the two opposite vertices are shared neighbours,
+    # and neither of them drops to valence 2
+    idx = np.flatnonzero(accept)
+    offsets, nbrs = topo.neighbours()
+    count = topo.degree[a[idx]]
+    owner = np.repeat(np.arange(len(idx)), count)
+    starts = np.repeat(offsets[a[idx]], count)
+    ring = nbrs[starts + np.arange(len(owner)) - np.repeat(np.cumsum(count) - count, count)]
+    common = np.bincount(owner[topo.has_edge(ring, b[idx][owner])], minlength=len(idx))
+    c = F.ravel()[(topo.he0[idx] // 3) * 3 + (topo.he0[idx] % 3 + 2) % 3]
+    d = F.ravel()[(topo.he1[idx] // 3) * 3 + (topo.he1[idx] % 3 + 2) % 3]
+    ok = (common == 2) & (topo.degree[c] > 3) & (topo.degree[d] > 3)
+    accept[idx[~ok]] = False
+    if not accept.any():
+        return V, F, 0
+
+    # Geometric checks on every face that survives the collapse: it must not
+    # flip over and its new edges must not exceed the split threshold
+    idx = np.flatnonzero(accept)
+    midpoint = 0.5 * (V[a[idx]] + V[b[idx]])
+    vertex_edge = np.full(topo.n, -1, dtype=np.int64)
+    vertex_edge[a[idx]] = np.arange(len(idx))
+    vertex_edge[b[idx]] = np.arange(len(idx))
+
+    face_edge = vertex_edge[F]
+    touched = (face_edge >= 0).sum(axis=1) == 1
+    ft = np.flatnonzero(touched)
+    local = np.argmax(face_edge[ft] >= 0, axis=1)
+    owner = face_edge[ft, local]
+
+    tri = V[F[ft]]
+    tri[np.arange(len(ft)), local] = midpoint[owner]
+    new_normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    # Reject folds, and any turn sharp enough to be taken for a crease later
+    flipped = np.einsum('ij,ij->i', new_normals, face_normals[ft]) <= (
+        max(cos_feature, 0.2) * np.linalg.norm(new_normals, axis=1))
+    others = tri[np.arange(len(ft))[:, None], (local[:, None] + [1, 2]) % 3]
+    too_long = (np.linalg.norm(others - midpoint[owner][:, None], axis=2) > high).any(axis=1)
+
+    rejected = np.zeros(len(idx), dtype=bool)
+    rejected[owner[flipped | too_long]] = True
+    idx = idx[~rejected]
+    if len(idx) == 0:
+        return V, F, 0
+
+    V = V.copy()
+    V[a[idx]] = 0.5 * (V[a[idx]] + V[b[idx]])
+    remap = np.arange(topo.n)
+    remap[b[idx]] = a[idx]
+    F = remap[F]
+    keep = (F[:, 0] != F[:, 1]) & (F[:, 1] != F[:, 2]) & (F[:, 2] != F[:, 0])
+    return V, F[keep], len(idx)
+
+
+def _flip_edges(V, F, cos_feature, rng):
+    """Flip an independent set of edges whose flip brings valences closer to 6 (4 on borders)."""
+    topo = _Topology(V, F)
+    two_sided = np.flatnonzero(topo.counts == 2)
+    if len(two_sided) == 0:
+        return F
+
+    h0, h1 = topo.he0[two_sided], topo.he1[two_sided]
+    f0, k0 = h0 // 3, h0 % 3
+    f1, k1 = h1 // 3, h1 % 3
+    a, b, c = F[f0, k0], F[f0, (k0 + 1) % 3], F[f0, (k0 + 2) % 3]
+    d = F[f1, (k1 + 2) % 3]
+
+    degree = topo.degree
+    target = np.where(topo.locked, 4, 6)
+    quad = np.stack([a, b, c, d], axis=1)
+    before = np.abs(degree[quad] - target[quad]).sum(axis=1)
+    after = np.abs(degree[quad] + [-1, -1, 1, 1] - target[quad]).sum(axis=1)
+
+    face_normals = _face_normals(V, F)
+    n0, n1 = face_normals[f0], face_normals[f1]
+    candidate = (
+        (after < before)
+        & (c != d)
+        & (degree[a] > 3) & (degree[b] > 3)
+        & (np.einsum('ij,ij->i', n0, n1) >= cos_feature)
+        & ~topo.has_edge(c, d)
+    )
+    if not candidate.any():
+        return F
+
+    # New faces (c, a, d) and (c, d, b) must stay consistently oriented
+    reference = n0 + n1
+    new0 = np.cross(V[a] - V[c], V[d] - V[c])
+    new1 = np.cross(V[d] - V[c], V[b] - V[c])
+    candidate &= (np.einsum('ij,ij->i', new0, reference) > 0) & (np.einsum('ij,ij->i', new1, reference) > 0)
+    if not candidate.any():
+        return F
+
+    # At most one flip per vertex, largest improvement first
+    prio = _unique_priority(after - before, candidate, rng)
+    vmin = np.full(topo.n, np.iinfo(np.int64).max, dtype=np.int64)
+    for col in range(4):
+        np.minimum.at(vmin, quad[candidate, col], prio[candidate])
+    accept = candidate & (prio == vmin[quad].min(axis=1))
+
+    F = F.copy()
+    F[f0[accept]] = np.stack([c[accept], a[accept], d[accept]], axis=1)
+    F[f1[accept]] = np.stack([c[accept], d[accept], b[accept]], axis=1)
+    return F
+
+
+def _tangential_relax(V, F, cos_feature, reference):
+    """Move free vertices towards their 1-ring centroid within the tangent plane."""
+    topo = _Topology(V, F)
+    face_normals = _face_normals(V, F)
+    fixed = topo.locked | _feature_vertices(topo, face_normals, cos_feature) | (topo.degree == 0)
+
+    e = topo.edges
+    n = topo.n
+    centroid = np.empty_like(V)
+    for axis in range(3):
+        centroid[:, axis] = (np.bincount(e[:, 0], V[e[:, 1], axis], minlength=n)
+                             + np.bincount(e[:, 1], V[e[:, 0], axis], minlength=n))
+    centroid /= np.maximum(topo.degree, 1)[:, None]
+
+    # Area-weighted vertex normals from unnormalized face normals
+    tri = V[F]
+    weighted = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    normals = np.empty_like(V)
+    for axis in range(3):
+        normals[:, axis] = np.bincount(F.ravel(), np.repeat(weighted[:, axis], 3), minlength=n)
+    norms = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.divide(normals, norms, out=np.zeros_like(normals), where=norms > 0)
+
+    free = np.flatnonzero(~fixed)
+    offset = V[free] - centroid[free]
+    relaxed = centroid[free] + normals[free] * np.einsum('ij,ij->i', offset, normals[free])[:, None]
+
+    if reference is not None and len(free):
+        relaxed = reference.project(relaxed)
+
+    V = V.copy()
+    V[free] = relaxed
+    return V
+
+
+def _compact(V, F):
+    """Drop unreferenced vertices and renumber faces."""
+    used = np.zeros(len(V), dtype=bool)
+    used[F.ravel()] = True
+    remap = np.cumsum(used) - 1
+    return V[used], remap[F]
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 ComfyUI-GeometryPack Contributors
+
+"""
+Numba kernel for Laplacian smoothing steps.
+
+Optional tier behind the scipy CSR path in remeshing/refine.py: a single
+parallel pass over the operator's CSR rows does the sparse product and the
+lambda update together, without the temporaries SpMM allocates each
+iteration. Check NUMBA_AVAILABLE before calling laplacian_step.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    # Don't print warning - the scipy path is used instead
+
+
+if NUMBA_AVAILABLE:
+    # Compiled once per session (and cached on disk), not per call
+    @njit(cache=True, parallel=True, fastmath=True)
+    def laplacian_step(out, vertices, indptr, indices, weights, lamb):
+        """
+        out = vertices + lamb * (L @ vertices - vertices) for CSR operator L.
+
+        Args:
+            out: (N, 3) float64 array receiving the result (not vertices)
+            vertices: (N, 3) float64 positions
+            indptr, indices, weights: CSR arrays of L
+            lamb: Step size
+        """
+        for v in prange(vertices.shape[0]):
+            sx = 0.0
+            sy = 0.0
+            sz = 0.0
+            for k in range(indptr[v], indptr[v + 1]):
+                w = weights[k]
+                j = indices[k]
+                sx += w * vertices[j, 0]
+                sy += w * vertices[j, 1]
+                sz += w * vertices[j, 2]
+            out[v, 0] = vertices[v, 0] + lamb * (sx - vertices[v, 0])
+            out[v, 1] = vertices[v, 1] + lamb * (sy - vertices[v, 1])
+            out[v, 2] = vertices[v, 2] + lamb * (sz - vertices[v, 2])
@@ -9,6 +9,7 @@ Handles mesh data structures, I/O, and processing using trimesh and CGAL
 import numpy as np
 import trimesh
 import os
+import contextlib
 from typing import Tuple, Optional
 
 # libigl for mesh processing operations
@@ -36,6 +37,14 @@ except ImportError:
     PYVISTA_AVAILABLE = False
     # Don't print warning - pyvista is optional
 
+# threadpoolctl caps OpenMP/BLAS thread pools used inside native backends
+try:
+    from threadpoolctl import threadpool_limits
+    THREADPOOLCTL_AVAILABLE = True
+except ImportError:
+    THREADPOOLCTL_AVAILABLE = False
+    # Don't print warning - thread limits are optional
+
 # Official CGAL Python bindings for isotropic remeshing
 try:
     from CGAL import CGAL_Polygon_mesh_processing
@@ -47,6 +56,18 @@ except ImportError:
     CGAL_AVAILABLE = False
     print("[mesh_utils] Warning: CGAL not available. Install with: pip install cgal")
 
+# OpenVDB Python bindings for in-process voxel remeshing (module renamed in OpenVDB 10)
+try:
+    import pyopenvdb as vdb
+    OPENVDB_AVAILABLE = True
+except ImportError:
+    try:
+        import openvdb as vdb
+        OPENVDB_AVAILABLE = True
+    except ImportError:
+        OPENVDB_AVAILABLE = False
+        # Don't print warning - Blender handles voxel remeshing without it
+
 
 def is_point_cloud(mesh) -> bool:
     """
@@ -87,6 +108,49 @@ def get_geometry_type(mesh) -> str:
     return "Point Cloud" if is_point_cloud(mesh) else "Mesh"
 
 
+def read_only_view(array):
+    """
+    Read-only view of an array, for handing shared buffers to another mesh.
+
+    ComfyUI caches node outputs, so a buffer shared between a node's input and
+    output must not be edited in place by any later node; with a read-only
+    view such an edit raises instead of corrupting the cached input. Trimesh
+    operations assign new arrays and are unaffected.
+    """
+    view = np.asarray(array).view()
+    view.flags.writeable = False
+    return view
+
+
+def shallow_copy_mesh(mesh: trimesh.Trimesh, copy_faces: bool = False) -> trimesh.Trimesh:
+    """
+    Copy a mesh for a node that only replaces (not edits) its arrays.
+
+    Unlike mesh.copy(), the vertex, face and attribute arrays are shared with
+    the input instead of duplicated, as read-only views (see read_only_view).
+    Metadata and the attribute dicts are new dicts, and the visual is copied
+    because trimesh binds it to its owning mesh.
+
+    Args:
+        mesh: Input trimesh.Trimesh
+        copy_faces: Give the copy its own writable face array, for callers
+            that rewrite it in place (e.g. trimesh's fix_normals flips faces
+            by index)
+
+    Returns:
+        New trimesh.Trimesh sharing the input's vertex (and face) arrays
+    """
+    return trimesh.Trimesh(
+        vertices=read_only_view(mesh.vertices),
+        faces=mesh.faces.copy() if copy_faces else read_only_view(mesh.faces),
+        visual=mesh.visual.copy() if mesh.visual is not None else None,
+        vertex_attributes={name: read_only_view(value) for name, value in mesh.vertex_attributes.items()},
+        face_attributes={name: read_only_view(value) for name, value in mesh.face_attributes.items()},
+        metadata=mesh.metadata.copy(),
+        process=False,
+    )
+
+
 def _load_vtk_mesh(file_path: str) -> Tuple[Optional[trimesh.Trimesh], str]:
     """
     Load VTK format files (VTP, VTU, VTK) using pyvista.
@@ -940,12 +1004,26 @@ def transfer_texture_via_closest_point(original_mesh: trimesh.Trimesh,
 # Remeshing via PyMeshLab
 # ============================================================================
 
+def _thread_limit(num_threads: int):
+    """
+    Context manager capping native (OpenMP/BLAS) worker threads.
+
+    num_threads <= 0 keeps the library default (all cores).
+    """
+    if num_threads and num_threads > 0:
+        if THREADPOOLCTL_AVAILABLE:
+            return threadpool_limits(limits=num_threads)
+        print(f"[GeomPack] Warning: num_threads={num_threads} ignored (pip install threadpoolctl)")
+    return contextlib.nullcontext()
+
+
 def pymeshlab_isotropic_remesh(
     mesh: trimesh.Trimesh,
     target_edge_length: float,
     iterations: int = 3,
     adaptive: bool = False,
-    feature_angle: float = 30.0
+    feature_angle: float = 30.0,
+    num_threads: int = 0
 ) -> Tuple[Optional[trimesh.Trimesh], str]:
     """
     Apply isotropic remeshing to create uniform triangle sizes using PyMeshLab.
@@ -956,6 +1034,7 @@ def pymeshlab_isotropic_remesh(
         iterations: Number of remeshing iterations (default: 3)
         adaptive: Use curvature-adaptive edge lengths (default: False)
         feature_angle: Angle threshold in degrees for feature edge detection (default: 30.0)
+        num_threads: Cap on native worker threads, 0 = library default (default: 0)
 
     Returns:
         Tuple of (remeshed_mesh, error_message)
@@ -967,6 +1046,7 @@ def pymeshlab_isotropic_remesh(
     print(f"[pymeshlab_isotropic_remesh]   iterations: {iterations}")
     print(f"[pymeshlab_isotropic_remesh]   adaptive: {adaptive}")
     print(f"[pymeshlab_isotropic_remesh]   feature_angle: {feature_angle}")
+    print(f"[pymeshlab_isotropic_remesh]   num_threads: {num_threads}")
 
     if not PYMESHLAB_AVAILABLE:
         return None, "pymeshlab is not installed. Install with: pip install pymeshlab"
@@ -988,10 +1068,10 @@ def pymeshlab_isotropic_remesh(
         print(f"[pymeshlab_isotropic_remesh] Converting to PyMeshLab format...")
         ms = pymeshlab.MeshSet()
 
-        # Create PyMeshLab mesh from numpy arrays
+        # Create PyMeshLab mesh from arrays already in its dtypes (float64 / int32)
         pml_mesh = pymeshlab.Mesh(
-            vertex_matrix=mesh.vertices,
-            face_matrix=mesh.faces
+            vertex_matrix=np.ascontiguousarray(mesh.vertices, dtype=np.float64),
+            face_matrix=np.ascontiguousarray(mesh.faces, dtype=np.int32)
         )
         ms.add_mesh(pml_mesh)
 
@@ -1003,35 +1083,37 @@ def pymeshlab_isotropic_remesh(
         target_pct = (target_edge_length / bbox_diag) * 100.0
 
         # Try new API name (v2022.2+), fall back to old name for backward compatibility
-        try:
-            ms.meshing_isotropic_explicit_remeshing(
-                targetlen=pymeshlab.PercentageValue(target_pct),
-                iterations=iterations,
-                adaptive=adaptive,
-                featuredeg=feature_angle
-            )
-        except AttributeError:
-            # Older PyMeshLab versions use 'remeshing_' prefix
+        with _thread_limit(num_threads):
             try:
-                ms.remeshing_isotropic_explicit_remeshing(
+                ms.meshing_isotropic_explicit_remeshing(
                     targetlen=pymeshlab.PercentageValue(target_pct),
                     iterations=iterations,
                     adaptive=adaptive,
                     featuredeg=feature_angle
                 )
-            except AttributeError as e:
-                return None, (
-                    "PyMeshLab meshing filter not available. "
-                    "This usually means the libfilter_meshing.so plugin failed to load. "
-                    "On Linux, install OpenGL libraries: sudo apt-get install libgl1-mesa-glx libglu1-mesa"
-                )
+            except AttributeError:
+                # Older PyMeshLab versions use 'remeshing_' prefix
+                try:
+                    ms.remeshing_isotropic_explicit_remeshing(
+                        targetlen=pymeshlab.PercentageValue(target_pct),
+                        iterations=iterations,
+                        adaptive=adaptive,
+                        featuredeg=feature_angle
+                    )
+                except AttributeError as e:
+                    return None, (
+                        "PyMeshLab meshing filter not available. "
+                        "This usually means the libfilter_meshing.so plugin failed to load. "
+                        "On Linux, install OpenGL libraries: sudo apt-get install libgl1-mesa-glx libglu1-mesa"
+                    )
 
         # Convert back to trimesh
         print(f"[pymeshlab_isotropic_remesh] Converting back to trimesh...")
         remeshed_pml = ms.current_mesh()
         remeshed_mesh = trimesh.Trimesh(
             vertices=remeshed_pml.vertex_matrix(),
-            faces=remeshed_pml.face_matrix()
+            faces=remeshed_pml.face_matrix(),
+            process=False
         )
 
         # Preserve metadata
@@ -1287,7 +1369,7 @@ def cgal_isotropic_remesh(
         new_faces = np.array(new_faces, dtype=np.int32)
 
         # Create new trimesh object
-        remeshed_mesh = trimesh.Trimesh(vertices=new_vertices, faces=new_faces)
+        remeshed_mesh = trimesh.Trimesh(vertices=new_vertices, faces=new_faces, process=False)
 
         # Preserve metadata
         remeshed_mesh.metadata = mesh.metadata.copy()
@@ -1323,6 +1405,158 @@ def cgal_isotropic_remesh(
         return None, error_msg
 
 
+def inprocess_isotropic_remesh(
+    mesh: trimesh.Trimesh,
+    target_edge_length: float,
+    iterations: int = 3,
+    feature_angle: float = 30.0,
+    protect_boundaries: bool = True
+) -> Tuple[Optional[trimesh.Trimesh], str]:
+    """
+    Apply isotropic remeshing in-process with the numpy remesher.
+
+    Runs the same split/collapse/flip/relax scheme as the CGAL and PyMeshLab
+    backends directly on the mesh arrays (see isotropic_remesh.py), so it
+    needs no native library and no mesh conversion.
+
+    Args:
+        mesh: Input trimesh object
+        target_edge_length: Target edge length for output triangles
+        iterations: Number of remeshing iterations (1-20)
+        feature_angle: Dihedral angle (degrees) above which edges are kept as creases
+        protect_boundaries: Keep boundary edges unchanged
+
+    Returns:
+        Tuple of (remeshed_mesh, error_message)
+    """
+    from .isotropic_remesh import isotropic_remesh
+
+    print(f"[inprocess_isotropic_remesh] Input: {len(mesh.vertices)} vertices, {len(mesh.faces)} faces")
+    print(f"[inprocess_isotropic_remesh] Parameters: target_edge_length={target_edge_length}, iterations={iterations}, feature_angle={feature_angle}, protect_boundaries={protect_boundaries}")
+
+    if not isinstance(mesh, trimesh.Trimesh):
+        return None, "Input must be a trimesh.Trimesh object"
+
+    if len(mesh.vertices) == 0 or len(mesh.faces) == 0:
+        return None, "Mesh is empty"
+
+    if target_edge_length <= 0:
+        return None, f"Target edge length must be positive, got {target_edge_length}"
+
+    if iterations < 1 or iterations > 20:
+        return None, f"Iterations must be between 1 and 20, got {iterations}"
+
+    try:
+        # The remesher works on edge connectivity, so weld duplicate vertices
+        # and drop degenerate faces first
+        welded = trimesh.Trimesh(vertices=mesh.vertices, faces=mesh.faces, process=True)
+        welded.update_faces(welded.nondegenerate_faces())
+
+        if protect_boundaries:
+            boundary = welded.edges[trimesh.grouping.group_rows(welded.edges_sorted, require_count=1)]
+            if len(boundary):
+                longest = np.linalg.norm(
+                    welded.vertices[boundary[:, 0]] - welded.vertices[boundary[:, 1]], axis=1).max()
+                if longest > 4.0 / 3.0 * target_edge_length:
+                    print(f"[inprocess_isotropic_remesh] WARNING: boundary edges up to {longest:.4f} are protected "
+                          f"and keep neighbouring faces coarse; disable protect_boundaries to refine them")
+
+        vertices, faces = isotropic_remesh(
+            welded.vertices, welded.faces, target_edge_length,
+            iterations=iterations,
+            feature_angle=feature_angle,
+            protect_boundaries=protect_boundaries
+        )
+        remeshed_mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+        # Preserve metadata
+        remeshed_mesh.metadata = mesh.metadata.copy()
+        remeshed_mesh.metadata['remeshing'] = {
+            'algorithm': 'inprocess_isotropic',
+            'target_edge_length': target_edge_length,
+            'iterations': iterations,
+            'feature_angle': feature_angle,
+            'protect_boundaries': protect_boundaries,
+            'original_vertices': len(mesh.vertices),
+            'original_faces': len(mesh.faces),
+            'remeshed_vertices': len(remeshed_mesh.vertices),
+            'remeshed_faces': len(remeshed_mesh.faces)
+        }
+
+        print(f"[inprocess_isotropic_remesh] Output: {len(remeshed_mesh.vertices)} vertices, {len(remeshed_mesh.faces)} faces")
+        return remeshed_mesh, ""
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        error_msg = f"Error during in-process remesh: {str(e)}"
+        print(f"[inprocess_isotropic_remesh] ERROR: {error_msg}")
+        return None, error_msg
+
+
+def openvdb_voxel_remesh(
+    mesh: trimesh.Trimesh,
+    voxel_size: float
+) -> Tuple[Optional[trimesh.Trimesh], str]:
+    """
+    Voxel remesh with OpenVDB directly, without starting Blender.
+
+    Builds a narrow-band level set from the triangles and extracts its zero
+    isosurface, which is what Blender's voxel remesher does internally.
+
+    Args:
+        mesh: Input trimesh object
+        voxel_size: Edge length of the voxels, in mesh units
+
+    Returns:
+        Tuple of (remeshed_mesh, error_message)
+    """
+    if not OPENVDB_AVAILABLE:
+        return None, "OpenVDB Python bindings are not installed"
+
+    if voxel_size <= 0:
+        return None, f"Voxel size must be positive, got {voxel_size}"
+
+    try:
+        grid = vdb.FloatGrid.createLevelSetFromPolygons(
+            np.ascontiguousarray(mesh.vertices, dtype=np.float32),
+            triangles=np.ascontiguousarray(mesh.faces, dtype=np.int32),
+            transform=vdb.createLinearTransform(voxelSize=voxel_size),
+            halfWidth=3.0
+        )
+        points, triangles, quads = grid.convertToPolygons(isovalue=0.0, adaptivity=0.0)
+
+        quads = np.asarray(quads, dtype=np.int64).reshape(-1, 4)
+        faces = np.concatenate([
+            np.asarray(triangles, dtype=np.int64).reshape(-1, 3),
+            quads[:, [0, 1, 2]],
+            quads[:, [0, 2, 3]]
+        ])
+        remeshed_mesh = trimesh.Trimesh(
+            vertices=np.asarray(points, dtype=np.float64), faces=faces, process=False
+        )
+        if len(remeshed_mesh.faces) == 0:
+            return None, "OpenVDB produced an empty mesh (voxel size too large?)"
+
+        # Level-set polygons come out facing inwards; orient them outwards
+        if remeshed_mesh.volume < 0:
+            remeshed_mesh.invert()
+
+        remeshed_mesh.metadata = mesh.metadata.copy()
+        remeshed_mesh.metadata['remeshing'] = {
+            'algorithm': 'openvdb_voxel',
+            'voxel_size': voxel_size,
+            'original_vertices': len(mesh.vertices),
+            'original_faces': len(mesh.faces)
+        }
+        return remeshed_mesh, ""
+
+    except Exception as e:
+        error_msg = f"Error during OpenVDB voxel remesh: {str(e)}"
+        print(f"[openvdb_voxel_remesh] ERROR: {error_msg}")
+        return None, error_msg
+
+
 # CuMesh availability check
 try:
     import cumesh as CuMesh
@@ -1368,8 +1602,9 @@ def cumesh_dc_remesh(
         print(f"[cumesh_dc_remesh] Band width: {band}")
 
         # Convert to GPU tensors
-        vertices = torch.tensor(mesh.vertices, dtype=torch.float32).cuda()
-        faces = torch.tensor(mesh.faces, dtype=torch.int32).cuda()
+        # from_numpy shares the (already converted) buffer instead of copying it again
+        vertices = torch.from_numpy(np.ascontiguousarray(mesh.vertices, dtype=np.float32)).cuda()
+        faces = torch.from_numpy(np.ascontiguousarray(mesh.faces, dtype=np.int32)).cuda()
 
         # Calculate bounding box and scale (same approach as TRELLIS2)
         bbox_min = vertices.min(dim=0).values
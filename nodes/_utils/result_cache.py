@@ -0,0 +1,300 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 ComfyUI-GeometryPack Contributors
+
+"""
+Disk cache for expensive mesh-to-mesh node results.
+
+Results are keyed by a content hash of the input vertices and faces, the
+operation's parameters and the versions of the libraries that computed them,
+so re-running a graph (or restarting ComfyUI) with the same mesh and settings
+reads the stored result instead of recomputing it, while upgrading a backend
+does not. Each entry is one uncompressed .npz holding the output arrays and
+attributes, the node's info text and the metadata entries the operation
+added. The cache is an LRU bounded in total size: hits refresh an entry's
+mtime and the oldest entries are evicted after each write.
+
+Caching is off unless GEOMPACK_CACHE_DIR names the cache directory (an empty
+value also disables it). GEOMPACK_CACHE_SIZE_GB sets the size bound
+(default 8).
+"""
+
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import trimesh
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+# Bump when the entry layout or the key recipe changes
+_FORMAT_VERSION = 2
+
+# Libraries behind every result (mesh construction and array handling)
+_BASE_LIBRARIES = ('numpy', 'trimesh')
+
+_DEFAULT_SIZE_GB = 8.0
+
+
+def cache_dir():
+    """Directory holding cache entries, or None if caching is disabled (the default)."""
+    configured = os.environ.get('GEOMPACK_CACHE_DIR')
+    return Path(configured) if configured else None
+
+
+def cache_size_limit():
+    """Total bytes of entries kept before the least recently used are evicted."""
+    try:
+        size_gb = float(os.environ.get('GEOMPACK_CACHE_SIZE_GB', _DEFAULT_SIZE_GB))
+    except ValueError:
+        size_gb = _DEFAULT_SIZE_GB
+    return int(size_gb * (1 << 30))
+
+
+def mesh_digest(mesh):
+    """Hex digest of a mesh's vertex and face arrays (dtypes and shapes included)."""
+    digest = xxhash.xxh3_128() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=16)
+    for array in (mesh.vertices, mesh.faces):
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _distribution_version(name):
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def library_versions(*distributions):
+    """
+    Installed versions of the given distributions (None if not installed).
+
+    Args:
+        *distributions: pip distribution names, e.g. "pymeshlab"
+
+    Returns:
+        dict: {name: version}
+    """
+    return {name: _distribution_version(name) for name in distributions}
+
+
+def cache_key(namespace, mesh, params, versions=None):
+    """File-name-safe key for (operation, input mesh, parameters, library versions)."""
+    versions = {**library_versions(*_BASE_LIBRARIES), **(versions or {})}
+    params_repr = json.dumps([params, versions], sort_keys=True, default=repr)
+    params_digest = hashlib.blake2b(
+        f"{_FORMAT_VERSION}:{params_repr}".encode(), digest_size=8
+    ).hexdigest()
+    return f"{namespace}_{mesh_digest(mesh)}_{params_digest}"
+
+
+def cached_call(namespace, mesh, params, compute, versions=None):
+    """
+    Return compute()'s (mesh, info) result, reusing a stored one for identical input.
+
+    Concurrent callers with the same key (ComfyUI worker threads or separate
+    processes) wait on a file lock, so the work is done once and the others
+    read the stored entry. Results that carry visuals (UVs, colors) or
+    non-numeric attributes are not stored, as the entry only holds arrays.
+
+    Args:
+        namespace: Name of the operation, e.g. "remesh"
+        mesh: Input trimesh.Trimesh object
+        params: Dict of every parameter that affects the result
+        compute: Zero-argument callable returning (result_mesh, info)
+        versions: Zero-argument callable returning a dict of versions of the
+            backend that computes the result (see library_versions); only
+            called when caching is enabled. numpy and trimesh are always
+            included
+
+    Returns:
+        tuple: (result_mesh, info)
+    """
+    root = cache_dir()
+    if root is None:
+        return compute()
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"[ResultCache] Cache directory unavailable ({e}), caching disabled")
+        return compute()
+
+    key = cache_key(namespace, mesh, params, versions() if versions is not None else None)
+    path = root / f"{key}.npz"
+
+    # Locks are striped by the key's last two hex digits (at most 256 files)
+    with _locked(root / f"lock_{key[-2:]}"):
+        cached = _load(path, mesh)
+        if cached is not None:
+            print(f"[ResultCache] Reusing cached {namespace} result ({path.name})")
+            return cached
+
+        result_mesh, info = compute()
+        if _store(path, mesh, result_mesh, info):
+            _evict(root, cache_size_limit())
+
+    return result_mesh, info
+
+
+@contextlib.contextmanager
+def _locked(lock_path):
+    """Hold an exclusive lock on lock_path (flock on POSIX, msvcrt on Windows)."""
+    with open(lock_path, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            lock_file.seek(0)
+            while True:
+                try:
+                    # LK_LOCK gives up after ~10 s; keep waiting for long computes
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            yield
+
+
+def _load(path, input_mesh):
+    """Rebuild a stored result, or None if there is no usable entry."""
+    try:
+        with np.load(path, allow_pickle=False) as entry:
+            vertices = entry['vertices']
+            faces = entry['faces']
+            info = str(entry['info'])
+            added_metadata = json.loads(str(entry['metadata']))
+            attribute_names = json.loads(str(entry['attributes']))
+            attributes = {
+                kind: {name: entry[f"{kind}_attribute_{i}"] for i, name in enumerate(names)}
+                for kind, names in attribute_names.items()
+            }
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, ValueError) as e:
+        print(f"[ResultCache] Ignoring unreadable entry {path.name}: {e}")
+        return None
+
+    # Mark as recently used for eviction
+    with contextlib.suppress(OSError):
+        os.utime(path)
+
+    result_mesh = trimesh.Trimesh(
+        vertices=vertices,
+        faces=faces,
+        vertex_attributes=attributes['vertex'],
+        face_attributes=attributes['face'],
+        process=False
+    )
+    result_mesh.metadata = input_mesh.metadata.copy()
+    result_mesh.metadata.update(added_metadata)
+    return result_mesh, info
+
+
+def _store(path, input_mesh, result_mesh, info):
+    """
+    Write a result entry atomically; results that cannot round-trip are skipped.
+
+    Returns:
+        bool: Whether an entry was written
+    """
+    if not isinstance(result_mesh, trimesh.Trimesh) or result_mesh.visual.kind is not None:
+        return False
+    if result_mesh is input_mesh:
+        return False  # Pass-through (nothing to do); recomputing it is free
+
+    added_metadata = {}
+    for name, value in result_mesh.metadata.items():
+        try:
+            unchanged = name in input_mesh.metadata and bool(input_mesh.metadata[name] == value)
+        except (ValueError, TypeError):
+            unchanged = False
+        if not unchanged:
+            added_metadata[name] = value
+    try:
+        metadata_json = json.dumps(added_metadata)
+    except (TypeError, ValueError):
+        return False
+
+    # Attributes are stored as numbered arrays; their names go in a JSON index
+    attribute_arrays = {}
+    attribute_names = {}
+    for kind, attributes in (('vertex', result_mesh.vertex_attributes),
+                             ('face', result_mesh.face_attributes)):
+        attribute_names[kind] = list(attributes)
+        for i, value in enumerate(attributes.values()):
+            value = np.asarray(value)
+            if value.dtype.hasobject:
+                return False
+            attribute_arrays[f"{kind}_attribute_{i}"] = value
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(
+                f,
+                vertices=np.asarray(result_mesh.vertices),
+                faces=np.asarray(result_mesh.faces),
+                info=np.array(info),
+                metadata=np.array(metadata_json),
+                attributes=np.array(json.dumps(attribute_names)),
+                **attribute_arrays
+            )
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[ResultCache] Could not write {path.name}: {e}")
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        return False
+    return True
+
+
+def _evict(root, size_limit):
+    """Delete least recently used entries until the total size fits size_limit."""
+    entries = []
+    for entry in os.scandir(root):
+        if entry.name.endswith('.npz'):
+            with contextlib.suppress(OSError):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= size_limit:
+            break
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+            total -= size
+            print(f"[ResultCache] Evicted {os.path.basename(path)}")
@@ -0,0 +1,241 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025 ComfyUI-GeometryPack Contributors
+
+"""
+Self-intersection detection on plain numpy arrays.
+
+Fallback for DetectSelfIntersectionsNode when libigl's CGAL module is not
+installed. Candidate face pairs come from a uniform grid over the faces'
+bounding boxes, so the work grows with the number of nearby pairs instead
+of with n^2, and the candidates are checked with Moller's triangle-triangle
+test vectorized over batches of pairs.
+
+Unlike CGAL's exact predicates this uses floating point with a small
+tolerance, and faces that share a vertex are never reported (they always
+touch; CGAL only reports them when they overlap beyond the shared part).
+"""
+
+import numpy as np
+
+
+# Faces whose bounding box covers more grid cells than this are paired by a
+# direct box test against all faces instead of being spread over the grid
+_MAX_CELLS_PER_FACE = 64
+
+# Candidate pairs tested per vectorized batch (bounds temporary memory)
+_BATCH_PAIRS = 1 << 18
+
+def intersecting_face_pairs(vertices, faces):
+    """
+    Find pairs of faces that intersect each other.
+
+    Args:
+        vertices: (N, 3) vertex positions
+        faces: (M, 3) triangle indices
+
+    Returns:
+        np.ndarray: (K, 2) int64 face index pairs with i < j, like the IF
+            output of igl.copyleft.cgal.remesh_self_intersections
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64)
+    if len(faces) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    triangles = vertices[faces]
+    lo = triangles.min(axis=1)
+    hi = triangles.max(axis=1)
+    scale = float((hi.max(axis=0) - lo.min(axis=0)).max()) or 1.0
+    eps = 1e-10 * scale
+
+    pairs = _candidate_pairs(lo, hi)
+
+    # Faces sharing a vertex always touch; adjacency is not an intersection
+    shared = (faces[pairs[:, 0], :, None] == faces[pairs[:, 1], None, :]).any(axis=(1, 2))
+    pairs = pairs[~shared]
+
+    hits = []
+    for start in range(0, len(pairs), _BATCH_PAIRS):
+        batch = pairs[start:start + _BATCH_PAIRS]
+        mask = _triangles_intersect(triangles[batch[:, 0]], triangles[batch[:, 1]], eps)
+        hits.append(batch[mask])
+    if not hits:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.concatenate(hits)
+
+
+def _candidate_pairs(lo, hi):
+    """Unique (i < j) face pairs whose bounding boxes overlap."""
+    n_faces = len(lo)
+    extent = (hi - lo).max(axis=1)
+
+    # Cells about the size of a typical face keep both the cells per face and
+    # the faces per cell small
+    cell = float(np.median(extent))
+    if cell <= 0:
+        cell = float(extent.max()) or 1.0
+    origin = lo.min(axis=0)
+    # Keep cell coordinates well inside int64 for near-degenerate faces
+    cell = max(cell, float((hi.max(axis=0) - origin).max()) / (1 << 40))
+    cell_lo = np.floor((lo - origin) / cell).astype(np.int64)
+    cell_hi = np.floor((hi - origin) / cell).astype(np.int64)
+    span = cell_hi - cell_lo + 1
+    n_cells = span.prod(axis=1, dtype=np.float64)  # float: spans of huge faces overflow
+
+    found = []
+
+    # Spread each regular face over the cells its box touches
+    regular = np.flatnonzero(n_cells <= _MAX_CELLS_PER_FACE)
+    counts = n_cells[regular].astype(np.int64)
+    face_ids = np.repeat(regular, counts)
+    local = np.arange(len(face_ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+    face_span = span[face_ids]
+    offsets = np.stack([
+        local % face_span[:, 0],
+        (local // face_span[:, 0]) % face_span[:, 1],
+        local // (face_span[:, 0] * face_span[:, 1]),
+    ], axis=1)
+    # Row-major cell index in wrapping 64-bit arithmetic: exact while the grid
+    # has fewer than 2^64 cells, a hash beyond that (small faces spread over a
+    # large extent). Colliding cells only add candidates, which the box test
+    # below removes
+    cells = (cell_lo[face_ids] + offsets).astype(np.uint64)
+    dims = (cell_hi.max(axis=0) + 1).astype(np.uint64)
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    face_ids = face_ids[order]
+
+    # Pair every face with each later face in the same cell: round d pairs
+    # entry k with entry k + d, keeping only entries with d later neighbours
+    group_start = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    group_size = np.diff(np.r_[group_start, len(keys)])
+    later = (np.repeat(group_start + group_size, group_size) - np.arange(len(keys)) - 1)
+    active = np.flatnonzero(later > 0)
+    step = 1
+    while len(active):
+        found.append(np.stack([face_ids[active], face_ids[active + step]], axis=1))
+        active = active[later[active] > step]
+        step += 1
+
+    # Oversized faces are boxed against everything directly
+    for face in np.flatnonzero(n_cells > _MAX_CELLS_PER_FACE):
+        overlap = np.flatnonzero(np.all(lo <= hi[face], axis=1) & np.all(hi >= lo[face], axis=1))
+        overlap = overlap[overlap != face]
+        found.append(np.stack([np.full(len(overlap), face), overlap], axis=1))
+
+    if not found:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.concatenate(found)
+
+    # Sharing a cell does not mean the boxes overlap
+    a, b = pairs[:, 0], pairs[:, 1]
+    pairs = pairs[np.all(lo[a] <= hi[b], axis=1) & np.all(lo[b] <= hi[a], axis=1)]
+
+    # Faces sharing several cells were paired once per cell
+    keys = np.sort(pairs.min(axis=1) * n_faces + pairs.max(axis=1))
+    keys = keys[np.r_[True, keys[1:] != keys[:-1]]]
+    return np.stack([keys // n_faces, keys % n_faces], axis=1)
+
+
+def _triangles_intersect(t1, t2, eps):
+    """Moller's triangle-triangle test for (K, 3, 3) arrays of paired triangles."""
+    n1 = _unit_normals(t1)
+    n2 = _unit_normals(t2)
+    valid = np.isfinite(n1).all(axis=1) & np.isfinite(n2).all(axis=1)
+
+    # Signed distances of each triangle's corners to the other's plane
+    d1 = np.einsum('kij,kj->ki', t1 - t2[:, :1], n2)
+    d2 = np.einsum('kij,kj->ki', t2 - t1[:, :1], n1)
+    d1[np.abs(d1) < eps] = 0.0
+    d2[np.abs(d2) < eps] = 0.0
+
+    separated = (
+        np.all(d1 > 0, axis=1) | np.all(d1 < 0, axis=1)
+        | np.all(d2 > 0, axis=1) | np.all(d2 < 0, axis=1)
+    )
+    candidates = valid & ~separated
+    coplanar = candidates & np.all(d1 == 0, axis=1)
+    crossing = candidates & ~coplanar
+
+    result = np.zeros(len(t1), dtype=bool)
+
+    if crossing.any():
+        # Both triangles cut the planes' intersection line in an interval;
+        # they intersect when the intervals overlap
+        idx = np.flatnonzero(crossing)
+        direction = np.cross(n1[idx], n2[idx])
+        lo1, hi1 = _line_interval(t1[idx], d1[idx], direction)
+        lo2, hi2 = _line_interval(t2[idx], d2[idx], direction)
+        result[idx] = (lo1 < hi2) & (lo2 < hi1)
+
+    if coplanar.any():
+        idx = np.flatnonzero(coplanar)
+        result[idx] = _coplanar_overlap(t1[idx], t2[idx], n1[idx])
+
+    return result
+
+
+def _unit_normals(triangles):
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    # Degenerate (zero-area) faces get non-finite normals and are never reported
+    return normals
+
+
+def _line_interval(triangles, dist, direction):
+    """Extent of a triangle's crossing of the other plane, projected on direction."""
+    proj = np.einsum('kij,kj->ki', triangles, direction)
+    values = []
+    for a, b in ((0, 1), (1, 2), (2, 0)):
+        da, db = dist[:, a], dist[:, b]
+        crosses = da * db < 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            t = da / (da - db)
+        values.append(np.where(crosses, proj[:, a] + (proj[:, b] - proj[:, a]) * t, np.nan))
+    for a in range(3):
+        values.append(np.where(dist[:, a] == 0, proj[:, a], np.nan))
+    values = np.stack(values, axis=1)
+    return np.nanmin(values, axis=1), np.nanmax(values, axis=1)
+
+
+def _coplanar_overlap(t1, t2, normals):
+    """Whether paired coplanar triangles overlap with positive area."""
+    # Project onto the coordinate plane the triangles are least inclined to
+    drop = np.argmax(np.abs(normals), axis=1)
+    keep = np.array([[1, 2], [0, 2], [0, 1]])[drop]
+    rows = np.arange(len(t1))[:, None, None]
+    p = t1[rows, np.arange(3)[None, :, None], keep[:, None, :]]
+    q = t2[rows, np.arange(3)[None, :, None], keep[:, None, :]]
+
+    overlap = np.zeros(len(t1), dtype=bool)
+
+    # Proper edge crossings
+    for i in range(3):
+        a, b = p[:, i], p[:, (i + 1) % 3]
+        for j in range(3):
+            c, d = q[:, j], q[:, (j + 1) % 3]
+            overlap |= (
+                (_orient(a, b, c) * _orient(a, b, d) < 0)
+                & (_orient(c, d, a) * _orient(c, d, b) < 0)
+            )
+
+    # Containment (corners or centroid strictly inside the other triangle);
+    # the centroid catches duplicated faces, whose edges only run collinear
+    for inner, outer in ((p, q), (q, p)):
+        for point in (inner[:, 0], inner[:, 1], inner[:, 2], inner.mean(axis=1)):
+            overlap |= _strictly_inside(point, outer)
+    return overlap
+
+
+def _orient(a, b, c):
+    return (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+
+
+def _strictly_inside(point, triangle):
+    s0 = _orient(triangle[:, 0], triangle[:, 1], point)
+    s1 = _orient(triangle[:, 1], triangle[:, 2], point)
+    s2 = _orient(triangle[:, 2], triangle[:, 0], point)
+    return ((s0 > 0) & (s1 > 0) & (s2 > 0)) | ((s0 < 0) & (s1 < 0) & (s2 < 0))
@@ -179,12 +179,12 @@ bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete()
 
 # Import mesh A
-bpy.ops.wm.obj_import(filepath='{input_a_path}')
+bpy.ops.wm.obj_import(filepath={input_a_path!r})
 obj_a = bpy.context.selected_objects[0]
 obj_a.name = "MeshA"
 
 # Import mesh B
-bpy.ops.wm.obj_import(filepath='{input_b_path}')
+bpy.ops.wm.obj_import(filepath={input_b_path!r})
 obj_b = bpy.context.selected_objects[0]
 obj_b.name = "MeshB"
 
@@ -195,7 +195,7 @@ bpy.context.view_layer.objects.active = obj_a
 
 # Add boolean modifier
 bool_mod = obj_a.modifiers.new(name="Boolean", type='BOOLEAN')
-bool_mod.operation = '{blender_op}'
+bool_mod.operation = {blender_op!r}
 bool_mod.object = obj_b
 bool_mod.solver = 'EXACT'
 
@@ -207,7 +207,7 @@ bpy.data.objects.remove(obj_b, do_unlink=True)
 
 # Export result
 bpy.ops.wm.obj_export(
-    filepath='{output_path}',
+    filepath={output_path!r},
     export_selected_objects=True,
     export_uv=False,
     export_materials=False
@@ -217,9 +217,7 @@ bpy.ops.wm.obj_export(
                 blender_bridge.run_blender_script(script, timeout=300)
 
                 # Load result
-                result = trimesh_module.load(output_path, process=False)
-                if isinstance(result, trimesh_module.Scene):
-                    result = result.dump(concatenate=True)
+                result = blender_bridge.load_exported_mesh(output_path, 'obj')
 
                 # Preserve metadata
                 result.metadata = mesh_a.metadata.copy()
@@ -203,7 +203,7 @@ try:
     # Blender file is already loaded, just export it
     print("[Blender] Exporting to GLB...")
     bpy.ops.export_scene.gltf(
-        filepath='{glb_cache_path}',
+        filepath={glb_cache_path!r},
         export_format='GLB',
         export_image_format='AUTO',
         export_materials='EXPORT'
@@ -71,12 +71,12 @@ try:
 
     # Import FBX
     print("[Blender] Importing FBX...")
-    bpy.ops.import_scene.fbx(filepath='{fbx_path}')
+    bpy.ops.import_scene.fbx(filepath={fbx_path!r})
 
     # Export as GLB
     print("[Blender] Exporting GLB...")
     bpy.ops.export_scene.gltf(
-        filepath='{glb_cache_path}',
+        filepath={glb_cache_path!r},
         export_format='GLB',
         export_image_format='AUTO',
         export_materials='EXPORT'
@@ -5,8 +5,28 @@
 Refine Mesh Node - Non-destructive mesh refinement operations
 """
 
+from collections import OrderedDict
+
+import numpy as np
 import trimesh as trimesh_module
 
+from .._utils import laplacian_numba
+from .._utils import mesh_ops
+from .._utils import result_cache
+
+# Distributions whose version goes into each decimation method's cache key
+_DECIMATION_LIBRARIES = {
+    "trimesh": ("fast-simplification",),
+    "pymeshlab": ("pymeshlab",),
+    "cumesh": ("cumesh", "torch"),
+}
+
+# Uniform Laplacians keyed by topology. Each node hands on a new mesh object,
+# but chained smoothing (or re-running with a different lambda) keeps the
+# same faces, so the operator is shared process-wide rather than per mesh.
+_LAPLACIAN_CACHE = OrderedDict()
+_LAPLACIAN_CACHE_SIZE = 4
+
 
 class RefineMeshNode:
     """
@@ -41,7 +61,10 @@ class RefineMeshNode:
                     "max": 10000000,
                     "step": 100
                 }),
-                "decimation_method": (["trimesh", "pymeshlab"], {"default": "trimesh"}),
+                "decimation_method": (["trimesh", "pymeshlab", "cumesh"], {
+                    "default": "trimesh",
+                    "tooltip": "Decimation backend. trimesh=fast-simplification QEM, pymeshlab=QEM preserving boundaries and normals, cumesh=GPU QEM (CUDA)"
+                }),
                 # Subdivision
                 "subdivision_iterations": ("INT", {
                     "default": 1,
@@ -89,22 +112,37 @@ class RefineMeshNode:
         print(f"[RefineMesh] Input: {initial_vertices} vertices, {initial_faces} faces")
         print(f"[RefineMesh] Operation: {operation}")
 
+        # Decimation and subdivision results are reused from the disk cache;
+        # smoothing is cheap and keeps visuals, so it always runs
         if operation == "decimation":
-            refined_mesh, info = self._decimate(trimesh, target_face_count, decimation_method)
+            refined_mesh, info = result_cache.cached_call(
+                "refine_decimation", trimesh,
+                {"target_face_count": target_face_count, "method": decimation_method},
+                lambda: self._decimate(trimesh, target_face_count, decimation_method),
+                versions=lambda: result_cache.library_versions(
+                    *_DECIMATION_LIBRARIES.get(decimation_method, ())
+                )
+            )
         elif operation == "subdivision_loop":
-            refined_mesh, info = self._subdivide(trimesh, subdivision_iterations, "loop")
+            refined_mesh, info = result_cache.cached_call(
+                "refine_subdivision_loop", trimesh, {"iterations": subdivision_iterations},
+                lambda: self._subdivide(trimesh, subdivision_iterations, "loop")
+            )
         elif operation == "subdivision_midpoint":
-            refined_mesh, info = self._subdivide(trimesh, subdivision_iterations, "midpoint")
+            refined_mesh, info = result_cache.cached_call(
+                "refine_subdivision_midpoint", trimesh, {"iterations": subdivision_iterations},
+                lambda: self._subdivide(trimesh, subdivision_iterations, "midpoint")
+            )
         elif operation == "laplacian_smoothing":
             refined_mesh, info = self._smooth(trimesh, smoothing_iterations, lambda_factor)
         else:
             raise ValueError(f"Unknown operation: {operation}")
 
-        vertex_change = len(refined_mesh.vertices) - initial_vertices
-        face_change = len(refined_mesh.faces) - initial_faces
+        refined_vertices = len(refined_mesh.vertices)
+        refined_faces = len(refined_mesh.faces)
 
-        print(f"[RefineMesh] Output: {len(refined_mesh.vertices)} vertices ({vertex_change:+d}), "
-              f"{len(refined_mesh.faces)} faces ({face_change:+d})")
+        print(f"[RefineMesh] Output: {refined_vertices} vertices ({refined_vertices - initial_vertices:+d}), "
+              f"{refined_faces} faces ({refined_faces - initial_faces:+d})")
 
         return (refined_mesh, info)
 
@@ -113,8 +151,32 @@ class RefineMeshNode:
         initial_vertices = len(trimesh.vertices)
         initial_faces = len(trimesh.faces)
 
+        # Nothing to collapse: skip the full edge-cost pass and pass the input through
+        if target_face_count >= initial_faces:
+            print(f"[RefineMesh] Target {target_face_count:,} >= {initial_faces:,} faces, skipping decimation")
+            info = f"""Refine Mesh Results (Decimation):
+
+Method: {method}
+Target Faces: {target_face_count:,}
+
+Input already has {initial_faces:,} faces; no decimation needed.
+"""
+            return trimesh, info
+
         if method == "trimesh":
-            decimated = trimesh.simplify_quadric_decimation(face_count=target_face_count)
+            # Same QEM collapse as trimesh.simplify_quadric_decimation, minus
+            # the merge/cleanup pass trimesh runs on the (already clean) result
+            try:
+                from fast_simplification import simplify
+            except ImportError:
+                raise ImportError("fast-simplification not installed. Install with: pip install fast-simplification")
+
+            vertices, faces = simplify(
+                points=trimesh.vertices.view(np.ndarray),
+                triangles=trimesh.faces.view(np.ndarray),
+                target_count=target_face_count
+            )
+            decimated = trimesh_module.Trimesh(vertices=vertices, faces=faces, process=False)
         elif method == "pymeshlab":
             try:
                 import pymeshlab
@@ -122,9 +184,10 @@ class RefineMeshNode:
                 raise ImportError("pymeshlab not installed. Install with: pip install pymeshlab")
 
             ms = pymeshlab.MeshSet()
+            # Hand over arrays already in pymeshlab's dtypes (float64 / int32)
             pml_mesh = pymeshlab.Mesh(
-                vertex_matrix=trimesh.vertices,
-                face_matrix=trimesh.faces
+                vertex_matrix=np.ascontiguousarray(trimesh.vertices, dtype=np.float64),
+                face_matrix=np.ascontiguousarray(trimesh.faces, dtype=np.int32)
             )
             ms.add_mesh(pml_mesh)
 
@@ -135,14 +198,41 @@ class RefineMeshNode:
                 preservetopology=False
             )
 
+            # vertex_matrix() is already compacted, so skip trimesh's cleanup pass
             decimated_pml = ms.current_mesh()
             decimated = trimesh_module.Trimesh(
                 vertices=decimated_pml.vertex_matrix(),
-                faces=decimated_pml.face_matrix()
+                faces=decimated_pml.face_matrix(),
+                process=False
+            )
+        elif method == "cumesh":
+            # GPU QEM: collapses run in parallel over independent edges on the
+            # device instead of popping one edge at a time off a CPU heap
+            try:
+                import torch
+                import cumesh as CuMesh
+            except ImportError:
+                raise ImportError("CuMesh not available. Install with CUDA support.")
+
+            cumesh_obj = CuMesh.CuMesh()
+            cumesh_obj.init(
+                torch.from_numpy(np.ascontiguousarray(trimesh.vertices, dtype=np.float32)).cuda(),
+                torch.from_numpy(np.ascontiguousarray(trimesh.faces, dtype=np.int32)).cuda()
+            )
+            cumesh_obj.simplify(target_face_count, verbose=False)
+
+            final_verts, final_faces = cumesh_obj.read()
+            decimated = trimesh_module.Trimesh(
+                vertices=final_verts.cpu().numpy(),
+                faces=final_faces.cpu().numpy(),
+                process=False
             )
         else:
             raise ValueError(f"Unknown decimation method: {method}")
 
+        decimated_vertices = len(decimated.vertices)
+        decimated_faces = len(decimated.faces)
+
         # Preserve metadata
         decimated.metadata = trimesh.metadata.copy()
         decimated.metadata['decimation'] = {
@@ -150,10 +240,10 @@ class RefineMeshNode:
             'target_face_count': target_face_count,
             'original_vertices': initial_vertices,
             'original_faces': initial_faces,
-            'reduction_ratio': len(decimated.faces) / initial_faces if initial_faces > 0 else 0
+            'reduction_ratio': decimated_faces / initial_faces if initial_faces > 0 else 0
         }
 
-        reduction_pct = 100.0 * (initial_faces - len(decimated.faces)) / initial_faces if initial_faces > 0 else 0
+        reduction_pct = 100.0 * (initial_faces - decimated_faces) / initial_faces if initial_faces > 0 else 0
 
         info = f"""Refine Mesh Results (Decimation):
 
@@ -165,8 +255,8 @@ Before:
   Faces: {initial_faces:,}
 
 After:
-  Vertices: {len(decimated.vertices):,}
-  Faces: {len(decimated.faces):,}
+  Vertices: {decimated_vertices:,}
+  Faces: {decimated_faces:,}
 
 Reduction: {reduction_pct:.1f}%
 """
@@ -177,18 +267,31 @@ Reduction: {reduction_pct:.1f}%
         initial_vertices = len(trimesh.vertices)
         initial_faces = len(trimesh.faces)
 
-        subdivided = trimesh.copy()
+        if iterations <= 0:
+            info = f"""Refine Mesh Results (Subdivision):
 
-        for i in range(iterations):
-            if method == "loop":
-                subdivided = subdivided.subdivide_loop(iterations=1)
-            elif method == "midpoint":
+Method: {method}
+Iterations: {iterations}
+
+No subdivision applied.
+"""
+            return trimesh, info
+
+        # Both methods return new meshes, so the input needs no defensive copy
+        if method == "loop":
+            # One call lets trimesh run all iterations on raw arrays
+            subdivided = trimesh.subdivide_loop(iterations=iterations)
+        elif method == "midpoint":
+            subdivided = trimesh
+            for _ in range(iterations):
                 subdivided = subdivided.subdivide()
-            else:
-                raise ValueError(f"Unknown subdivision method: {method}")
+        else:
+            raise ValueError(f"Unknown subdivision method: {method}")
 
-            print(f"[RefineMesh] Subdivision iteration {i+1}/{iterations}: "
-                  f"{len(subdivided.vertices)} vertices, {len(subdivided.faces)} faces")
+        subdivided_vertices = len(subdivided.vertices)
+        subdivided_faces = len(subdivided.faces)
+        print(f"[RefineMesh] Subdivision ({iterations} iterations): "
+              f"{subdivided_vertices} vertices, {subdivided_faces} faces")
 
         # Preserve metadata
         subdivided.metadata = trimesh.metadata.copy()
@@ -197,7 +300,7 @@ Reduction: {reduction_pct:.1f}%
             'iterations': iterations,
             'original_vertices': initial_vertices,
             'original_faces': initial_faces,
-            'multiplier': len(subdivided.faces) / initial_faces if initial_faces > 0 else 0
+            'multiplier': subdivided_faces / initial_faces if initial_faces > 0 else 0
         }
 
         info = f"""Refine Mesh Results (Subdivision):
@@ -210,20 +313,27 @@ Before:
   Faces: {initial_faces:,}
 
 After:
-  Vertices: {len(subdivided.vertices):,}
-  Faces: {len(subdivided.faces):,}
+  Vertices: {subdivided_vertices:,}
+  Faces: {subdivided_faces:,}
 
-Multiplier: {len(subdivided.faces) / initial_faces:.2f}x
+Multiplier: {subdivided_faces / initial_faces:.2f}x
 """
         return subdivided, info
 
     def _smooth(self, trimesh, iterations, lambda_factor):
         """Apply Laplacian smoothing."""
-        smoothed = trimesh.copy()
-        smoothed = trimesh_module.smoothing.filter_laplacian(
-            smoothed,
-            lamb=lambda_factor,
-            iterations=iterations
+        # Topology is unchanged, so share the input's faces and attributes
+        # (read-only) rather than deep-copying the whole mesh (and its caches)
+        # just to replace vertices
+        smoothed = trimesh_module.Trimesh(
+            vertices=_laplacian_smooth(trimesh, lambda_factor, iterations),
+            faces=mesh_ops.read_only_view(trimesh.faces),
+            visual=trimesh.visual.copy() if trimesh.visual.kind is not None else None,
+            vertex_attributes={name: mesh_ops.read_only_view(value)
+                               for name, value in trimesh.vertex_attributes.items()},
+            face_attributes={name: mesh_ops.read_only_view(value)
+                             for name, value in trimesh.face_attributes.items()},
+            process=False
         )
 
         # Preserve metadata
@@ -245,3 +355,76 @@ Faces: {len(smoothed.faces):,}
 Smoothing reduces surface roughness and noise.
 """
         return smoothed, info
+
+
+def _laplacian_smooth(mesh, lamb, iterations):
+    """
+    Explicit uniform Laplacian smoothing with volume preservation.
+
+    Same scheme as trimesh.smoothing.filter_laplacian (defaults), but the
+    operator is a cached CSR matrix (see _laplacian_operator) and the
+    per-iteration volume uses the closed-form signed tetrahedron sum instead
+    of full mass properties, which dominated the runtime on large meshes.
+    With numba installed, each step runs as one parallel pass over the CSR
+    rows (see laplacian_numba) instead of a scipy product.
+
+    Returns:
+        np.ndarray: Smoothed (N, 3) float64 vertex positions
+    """
+    laplacian = _laplacian_operator(mesh)
+    vertices = np.array(mesh.vertices, dtype=np.float64)
+    faces = mesh.faces.view(np.ndarray)
+
+    vol_ini, center_mass = _volume_and_centroid(vertices, faces)
+    # Rescaling is meaningless for flat or degenerate (e.g. open, planar) meshes
+    keep_volume = np.isfinite(vol_ini) and abs(vol_ini) > 1e-12
+
+    # The numba step writes into a second buffer; the two are swapped each pass
+    scratch = np.empty_like(vertices) if laplacian_numba.NUMBA_AVAILABLE else None
+
+    for _ in range(iterations):
+        if scratch is not None:
+            laplacian_numba.laplacian_step(
+                scratch, vertices, laplacian.indptr, laplacian.indices, laplacian.data, lamb
+            )
+            vertices, scratch = scratch, vertices
+        else:
+            vertices += lamb * (laplacian @ vertices - vertices)
+
+        if keep_volume:
+            tri = vertices[faces]
+            vol_new = np.einsum('ij,ij->', tri[:, 0], np.cross(tri[:, 1], tri[:, 2])) / 6.0
+            if vol_new * vol_ini > 0:
+                vertices -= center_mass
+                vertices *= (vol_ini / vol_new) ** (1.0 / 3.0)
+                vertices += center_mass
+
+    return vertices
+
+
+def _laplacian_operator(mesh):
+    """Uniform-weight CSR Laplacian for mesh's topology, from a small LRU cache."""
+    # TrackedArray memoizes its content hash until the faces are modified
+    key = (len(mesh.vertices), len(mesh.faces), hash(mesh.faces))
+    laplacian = _LAPLACIAN_CACHE.get(key)
+    if laplacian is not None:
+        _LAPLACIAN_CACHE.move_to_end(key)
+        return laplacian
+
+    laplacian = trimesh_module.smoothing.laplacian_calculation(mesh).tocsr()
+    _LAPLACIAN_CACHE[key] = laplacian
+    if len(_LAPLACIAN_CACHE) > _LAPLACIAN_CACHE_SIZE:
+        _LAPLACIAN_CACHE.popitem(last=False)
+    return laplacian
+
+
+def _volume_and_centroid(vertices, faces):
+    """Signed volume and volume centroid of a triangle mesh via origin-apex tetrahedra."""
+    tri = vertices[faces]
+    tet_volumes = np.einsum('ij,ij->i', tri[:, 0], np.cross(tri[:, 1], tri[:, 2])) / 6.0
+    volume = tet_volumes.sum()
+    if volume == 0:
+        return 0.0, vertices.mean(axis=0)
+    # Tetrahedron centroid is (v0 + v1 + v2 + origin) / 4
+    centroid = (tet_volumes @ tri.sum(axis=1)) / (4.0 * volume)
+    return volume, centroid
@@ -10,6 +10,20 @@ import trimesh as trimesh_module
 
 from .._utils import mesh_ops
 from .._utils import blender_bridge
+from .._utils import result_cache
+
+# Backends driven by target_edge_length
+_ISOTROPIC_BACKENDS = ("pymeshlab_isotropic", "cgal_isotropic", "inprocess_isotropic")
+
+# Distributions whose version goes into each backend's result cache key
+_BACKEND_LIBRARIES = {
+    "pymeshlab_isotropic": ("pymeshlab",),
+    "cgal_isotropic": ("cgal",),
+    "inprocess_isotropic": ("scipy",),
+    "blender_voxel": ("openvdb", "pyopenvdb"),
+    "instant_meshes": ("PyNanoInstantMeshes",),
+    "cumesh": ("cumesh", "torch"),
+}
 
 
 class RemeshNode:
@@ -20,7 +34,9 @@ class RemeshNode:
     - cumesh: GPU-accelerated dual-contouring remeshing (same as TRELLIS2)
     - pymeshlab_isotropic: PyMeshLab isotropic remeshing
     - cgal_isotropic: CGAL high-quality isotropic remeshing
-    - blender_voxel: Blender voxel-based remeshing (watertight output)
+    - inprocess_isotropic: Isotropic remeshing in numpy, no native library needed
+    - blender_voxel: Blender voxel-based remeshing (watertight output; runs
+      in-process through OpenVDB when its Python bindings are installed)
     - blender_quadriflow: Blender Quadriflow quad remeshing
     - instant_meshes: Field-aligned quad remeshing
 
@@ -35,25 +51,26 @@ class RemeshNode:
                 "backend": ([
                     "pymeshlab_isotropic",
                     "cgal_isotropic",
+                    "inprocess_isotropic",
                     "blender_voxel",
                     "blender_quadriflow",
                     "instant_meshes",
                     "cumesh",
                 ], {
                     "default": "pymeshlab_isotropic",
-                    "tooltip": "Remeshing algorithm. pymeshlab=fast isotropic, cgal=high-quality isotropic, blender_voxel=watertight output, blender_quadriflow=quad remesh, cumesh=GPU dual-contouring, instant_meshes=field-aligned quads"
+                    "tooltip": "Remeshing algorithm. pymeshlab=fast isotropic, cgal=high-quality isotropic, inprocess=isotropic without native dependencies, blender_voxel=watertight output, blender_quadriflow=quad remesh, cumesh=GPU dual-contouring, instant_meshes=field-aligned quads"
                 }),
             },
             "optional": {
-                # Isotropic params (pymeshlab, cgal)
+                # Isotropic params (pymeshlab, cgal, inprocess)
                 "target_edge_length": ("FLOAT", {
                     "default": 1.00,
-                    "min": 0.001,
+                    "min": 0.0,
                     "max": 10.0,
                     "step": 0.01,
                     "display": "number",
-                    "tooltip": "Target edge length for output triangles. Value is relative to mesh scale.",
-                    "backends": ["pymeshlab_isotropic", "cgal_isotropic"],
+                    "tooltip": "Target edge length for output triangles. Value is relative to mesh scale. 0 = auto (the input's mean edge length).",
+                    "backends": ["pymeshlab_isotropic", "cgal_isotropic", "inprocess_isotropic"],
                 }),
                 "iterations": ("INT", {
                     "default": 3,
@@ -61,7 +78,7 @@ class RemeshNode:
                     "max": 20,
                     "step": 1,
                     "tooltip": "Number of remeshing passes. More iterations = smoother result, slower processing.",
-                    "backends": ["pymeshlab_isotropic", "cgal_isotropic"],
+                    "backends": ["pymeshlab_isotropic", "cgal_isotropic", "inprocess_isotropic"],
                 }),
                 # PyMeshLab-specific
                 "feature_angle": ("FLOAT", {
@@ -70,18 +87,26 @@ class RemeshNode:
                     "max": 180.0,
                     "step": 1.0,
                     "tooltip": "Angle threshold (degrees) for feature edge detection. Edges with dihedral angle greater than this are preserved as sharp creases.",
-                    "backends": ["pymeshlab_isotropic"],
+                    "backends": ["pymeshlab_isotropic", "inprocess_isotropic"],
                 }),
                 "adaptive": (["true", "false"], {
                     "default": "false",
                     "tooltip": "Use curvature-adaptive edge lengths. Creates smaller triangles in high-curvature areas, larger triangles in flat areas.",
                     "backends": ["pymeshlab_isotropic"],
                 }),
+                "num_threads": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 64,
+                    "step": 1,
+                    "tooltip": "Maximum worker threads for the native remesher. 0 = use all cores. Lower this when running several workflows in parallel.",
+                    "backends": ["pymeshlab_isotropic"],
+                }),
                 # CGAL-specific
                 "protect_boundaries": (["true", "false"], {
                     "default": "true",
                     "tooltip": "Lock boundary/open edges in place during remeshing. Prevents modification of mesh borders and holes.",
-                    "backends": ["cgal_isotropic"],
+                    "backends": ["cgal_isotropic", "inprocess_isotropic"],
                 }),
                 # Blender voxel
                 "voxel_size": ("FLOAT", {
@@ -143,7 +168,7 @@ class RemeshNode:
     OUTPUT_NODE = True
 
     def remesh(self, trimesh, backend, target_edge_length=0.05, iterations=3,
-               feature_angle=30.0, adaptive="false",
+               feature_angle=30.0, adaptive="false", num_threads=0,
                protect_boundaries="true", voxel_size=0.02, target_face_count=500000,
                target_vertex_count=5000, deterministic="true", crease_angle=0.0,
                remesh_band=1.0):
@@ -161,14 +186,23 @@ class RemeshNode:
         initial_vertices = len(trimesh.vertices)
         initial_faces = len(trimesh.faces)
 
+        self._validate_inputs(trimesh, backend, voxel_size, target_face_count)
+
+        if target_edge_length <= 0 and backend in _ISOTROPIC_BACKENDS:
+            # Auto: keep the input's average resolution and only even out the triangles
+            target_edge_length = float(trimesh.edges_unique_length.mean())
+            print(f"[Remesh] Auto target_edge_length: {target_edge_length:.6g} (input mean edge length)")
+
         # Log backend and parameters
         print(f"\n{'='*60}")
         print(f"[Remesh] Backend: {backend}")
         print(f"[Remesh] Input: {initial_vertices:,} vertices, {initial_faces:,} faces")
         if backend == "pymeshlab_isotropic":
-            print(f"[Remesh] Parameters: target_edge_length={target_edge_length}, iterations={iterations}, feature_angle={feature_angle}, adaptive={adaptive}")
+            print(f"[Remesh] Parameters: target_edge_length={target_edge_length}, iterations={iterations}, feature_angle={feature_angle}, adaptive={adaptive}, num_threads={num_threads}")
         elif backend == "cgal_isotropic":
             print(f"[Remesh] Parameters: target_edge_length={target_edge_length}, iterations={iterations}, protect_boundaries={protect_boundaries}")
+        elif backend == "inprocess_isotropic":
+            print(f"[Remesh] Parameters: target_edge_length={target_edge_length}, iterations={iterations}, feature_angle={feature_angle}, protect_boundaries={protect_boundaries}")
         elif backend == "blender_voxel":
             print(f"[Remesh] Parameters: voxel_size={voxel_size}")
         elif backend == "blender_quadriflow":
@@ -179,47 +213,115 @@ class RemeshNode:
             print(f"[Remesh] Parameters: target_face_count={target_face_count:,}, remesh_band={remesh_band}")
         print(f"{'='*60}\n")
 
+        options = dict(
+            target_edge_length=target_edge_length, iterations=iterations,
+            feature_angle=feature_angle, adaptive=adaptive, num_threads=num_threads,
+            protect_boundaries=protect_boundaries, voxel_size=voxel_size,
+            target_face_count=target_face_count, target_vertex_count=target_vertex_count,
+            deterministic=deterministic, crease_angle=crease_angle, remesh_band=remesh_band
+        )
+        if backend == "instant_meshes" and deterministic == "false":
+            # Non-reproducible by request, so a stored result would be wrong to reuse
+            remeshed_mesh, info = self._run_backend(trimesh, backend, **options)
+        else:
+            remeshed_mesh, info = result_cache.cached_call(
+                "remesh", trimesh, self._cache_params(backend, options),
+                lambda: self._run_backend(trimesh, backend, **options),
+                versions=lambda: self._backend_versions(backend)
+            )
+
+        remeshed_vertices = len(remeshed_mesh.vertices)
+        remeshed_faces = len(remeshed_mesh.faces)
+
+        print(f"[Remesh] Output: {remeshed_vertices} vertices ({remeshed_vertices - initial_vertices:+d}), "
+              f"{remeshed_faces} faces ({remeshed_faces - initial_faces:+d})")
+
+        return {"ui": {"text": [info]}, "result": (remeshed_mesh, info)}
+
+    def _validate_inputs(self, trimesh, backend, voxel_size, target_face_count):
+        """Reject degenerate inputs before any backend (or Blender subprocess) runs."""
+        if len(trimesh.faces) == 0:
+            raise ValueError("Input mesh has no faces")
+        if not np.isfinite(trimesh.vertices).all():
+            raise ValueError("Input mesh has non-finite (NaN/Inf) vertex coordinates")
+
+        if backend == "blender_voxel":
+            if voxel_size <= 0:
+                raise ValueError(f"voxel_size must be positive, got {voxel_size}")
+            min_extent = float(np.min(trimesh.extents))
+            if min_extent < voxel_size:
+                print(f"[Remesh] Warning: voxel_size={voxel_size} is larger than the smallest "
+                      f"mesh extent ({min_extent:.4g}); thin parts may disappear")
+        elif backend == "blender_quadriflow":
+            if target_face_count < 4:
+                raise ValueError(f"target_face_count must be at least 4, got {target_face_count}")
+
+    def _run_backend(self, trimesh, backend, target_edge_length, iterations, feature_angle,
+                     adaptive, num_threads, protect_boundaries, voxel_size, target_face_count,
+                     target_vertex_count, deterministic, crease_angle, remesh_band):
+        """Dispatch to the selected backend; returns (remeshed_mesh, info)."""
         if backend == "pymeshlab_isotropic":
-            remeshed_mesh, info = self._pymeshlab_isotropic(
-                trimesh, target_edge_length, iterations, feature_angle, adaptive
+            return self._pymeshlab_isotropic(
+                trimesh, target_edge_length, iterations, feature_angle, adaptive, num_threads
             )
         elif backend == "cgal_isotropic":
-            remeshed_mesh, info = self._cgal_isotropic(
+            return self._cgal_isotropic(
                 trimesh, target_edge_length, iterations, protect_boundaries
             )
+        elif backend == "inprocess_isotropic":
+            return self._inprocess_isotropic(
+                trimesh, target_edge_length, iterations, feature_angle, protect_boundaries
+            )
         elif backend == "blender_voxel":
-            remeshed_mesh, info = self._blender_voxel(trimesh, voxel_size)
+            return self._blender_voxel(trimesh, voxel_size)
         elif backend == "blender_quadriflow":
-            remeshed_mesh, info = self._blender_quadriflow(trimesh, target_face_count)
+            return self._blender_quadriflow(trimesh, target_face_count)
         elif backend == "instant_meshes":
-            remeshed_mesh, info = self._instant_meshes(
+            return self._instant_meshes(
                 trimesh, target_vertex_count, deterministic, crease_angle
             )
         elif backend == "cumesh":
-            remeshed_mesh, info = self._cumesh(
+            return self._cumesh(
                 trimesh, remesh_band, target_face_count
             )
         else:
             raise ValueError(f"Unknown backend: {backend}")
 
-        vertex_change = len(remeshed_mesh.vertices) - initial_vertices
-        face_change = len(remeshed_mesh.faces) - initial_faces
-
-        print(f"[Remesh] Output: {len(remeshed_mesh.vertices)} vertices ({vertex_change:+d}), "
-              f"{len(remeshed_mesh.faces)} faces ({face_change:+d})")
-
-        return {"ui": {"text": [info]}, "result": (remeshed_mesh, info)}
-
-    def _pymeshlab_isotropic(self, trimesh, target_edge_length, iterations, feature_angle, adaptive):
+    @classmethod
+    def _cache_params(cls, backend, options):
+        """The options that affect the given backend's result (per INPUT_TYPES "backends")."""
+        optional = cls.INPUT_TYPES()["optional"]
+        params = {"backend": backend}
+        for name, value in options.items():
+            if backend in optional[name][1].get("backends", []):
+                params[name] = value
+        return params
+
+    @staticmethod
+    def _backend_versions(backend):
+        """Versions of the libraries (and Blender) that produce the backend's result."""
+        versions = result_cache.library_versions(*_BACKEND_LIBRARIES.get(backend, ()))
+        # Voxel remeshing only goes through Blender when OpenVDB is missing
+        if backend == "blender_quadriflow" or (backend == "blender_voxel" and not mesh_ops.OPENVDB_AVAILABLE):
+            versions["blender"] = blender_bridge.blender_version()
+        return versions
+
+    def _pymeshlab_isotropic(self, trimesh, target_edge_length, iterations, feature_angle, adaptive,
+                             num_threads=0):
         """PyMeshLab isotropic remeshing."""
+        initial_vertices = len(trimesh.vertices)
+        initial_faces = len(trimesh.faces)
         adaptive_bool = (adaptive == "true")
         remeshed_mesh, error = mesh_ops.pymeshlab_isotropic_remesh(
             trimesh, target_edge_length, iterations,
-            adaptive=adaptive_bool, feature_angle=feature_angle
+            adaptive=adaptive_bool, feature_angle=feature_angle, num_threads=num_threads
         )
         if remeshed_mesh is None:
             raise ValueError(f"PyMeshLab remeshing failed: {error}")
 
+        remeshed_vertices = len(remeshed_mesh.vertices)
+        remeshed_faces = len(remeshed_mesh.faces)
+
         info = f"""Remesh Results (PyMeshLab Isotropic):
 
 Target Edge Length: {target_edge_length}
@@ -228,17 +330,19 @@ Feature Angle: {feature_angle}°
 Adaptive: {adaptive}
 
 Before:
-  Vertices: {len(trimesh.vertices):,}
-  Faces: {len(trimesh.faces):,}
+  Vertices: {initial_vertices:,}
+  Faces: {initial_faces:,}
 
 After:
-  Vertices: {len(remeshed_mesh.vertices):,}
-  Faces: {len(remeshed_mesh.faces):,}
+  Vertices: {remeshed_vertices:,}
+  Faces: {remeshed_faces:,}
 """
         return remeshed_mesh, info
 
     def _cgal_isotropic(self, trimesh, target_edge_length, iterations, protect_boundaries):
         """CGAL isotropic remeshing."""
+        initial_vertices = len(trimesh.vertices)
+        initial_faces = len(trimesh.faces)
         protect = (protect_boundaries == "true")
         remeshed_mesh, error = mesh_ops.cgal_isotropic_remesh(
             trimesh, target_edge_length, iterations, protect
@@ -246,6 +350,9 @@ After:
         if remeshed_mesh is None:
             raise ValueError(f"CGAL remeshing failed: {error}")
 
+        remeshed_vertices = len(remeshed_mesh.vertices)
+        remeshed_faces = len(remeshed_mesh.faces)
+
         info = f"""Remesh Results (CGAL Isotropic):
 
 Target Edge Length: {target_edge_length}
@@ -253,129 +360,123 @@ Iterations: {iterations}
 Protect Boundaries: {protect_boundaries}
 
 Before:
-  Vertices: {len(trimesh.vertices):,}
-  Faces: {len(trimesh.faces):,}
+  Vertices: {initial_vertices:,}
+  Faces: {initial_faces:,}
+
+After:
+  Vertices: {remeshed_vertices:,}
+  Faces: {remeshed_faces:,}
+"""
+        return remeshed_mesh, info
+
+    def _inprocess_isotropic(self, trimesh, target_edge_length, iterations, feature_angle,
+                             protect_boundaries):
+        """In-process numpy isotropic remeshing."""
+        initial_vertices = len(trimesh.vertices)
+        initial_faces = len(trimesh.faces)
+        protect = (protect_boundaries == "true")
+        remeshed_mesh, error = mesh_ops.inprocess_isotropic_remesh(
+            trimesh, target_edge_length, iterations,
+            feature_angle=feature_angle, protect_boundaries=protect
+        )
+        if remeshed_mesh is None:
+            raise ValueError(f"In-process remeshing failed: {error}")
+
+        remeshed_vertices = len(remeshed_mesh.vertices)
+        remeshed_faces = len(remeshed_mesh.faces)
+
+        info = f"""Remesh Results (In-Process Isotropic):
+
+Target Edge Length: {target_edge_length}
+Iterations: {iterations}
+Feature Angle: {feature_angle}°
+Protect Boundaries: {protect_boundaries}
+
+Before:
+  Vertices: {initial_vertices:,}
+  Faces: {initial_faces:,}
 
 After:
-  Vertices: {len(remeshed_mesh.vertices):,}
-  Faces: {len(remeshed_mesh.faces):,}
+  Vertices: {remeshed_vertices:,}
+  Faces: {remeshed_faces:,}
 """
         return remeshed_mesh, info
 
     def _blender_voxel(self, trimesh, voxel_size):
         """Blender voxel remeshing."""
-        script = f"""
-import bpy
-
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
-
-# Import mesh
-bpy.ops.wm.obj_import(filepath='{{input_path}}')
-
-# Get imported object
-obj = bpy.context.selected_objects[0]
-bpy.context.view_layer.objects.active = obj
-
-# Apply voxel remesh
-obj.data.remesh_voxel_size = {voxel_size}
-bpy.ops.object.voxel_remesh()
-
-# Export remeshed object
-bpy.ops.wm.obj_export(
-    filepath='{{output_path}}',
-    export_selected_objects=True,
-    export_uv=False,
-    export_materials=False
-)
-"""
+        initial_vertices = len(trimesh.vertices)
+        initial_faces = len(trimesh.faces)
+        remeshed_mesh = None
+        engine = "Blender"
+        if mesh_ops.OPENVDB_AVAILABLE:
+            # Same OpenVDB level-set remesh Blender runs, minus the subprocess
+            print(f"[Remesh] Running OpenVDB voxel remesh in-process (voxel_size={voxel_size})...")
+            remeshed_mesh, error = mesh_ops.openvdb_voxel_remesh(trimesh, voxel_size)
+            if remeshed_mesh is None:
+                print(f"[Remesh] OpenVDB voxel remesh failed ({error}), falling back to Blender")
+            else:
+                engine = "OpenVDB"
 
-        print(f"[Remesh] Running Blender voxel remesh (voxel_size={voxel_size})...")
-        remeshed_mesh = blender_bridge.run_blender_mesh_operation(
-            trimesh, script,
-            metadata_key='remeshing',
-            metadata_values={
-                'algorithm': 'blender_voxel',
-                'voxel_size': voxel_size,
-                'original_vertices': len(trimesh.vertices),
-                'original_faces': len(trimesh.faces)
-            }
-        )
+        if remeshed_mesh is None:
+            print(f"[Remesh] Running Blender voxel remesh (voxel_size={voxel_size})...")
+            remeshed_mesh = blender_bridge.run_blender_mesh_script(
+                trimesh, 'voxel_remesh.py', ['--voxel-size', format(voxel_size, '.8g')],
+                metadata_key='remeshing',
+                metadata_values={
+                    'algorithm': 'blender_voxel',
+                    'voxel_size': voxel_size,
+                    'original_vertices': initial_vertices,
+                    'original_faces': initial_faces
+                }
+            )
 
-        info = f"""Remesh Results (Blender Voxel):
+        remeshed_vertices = len(remeshed_mesh.vertices)
+        remeshed_faces = len(remeshed_mesh.faces)
+
+        info = f"""Remesh Results ({engine} Voxel):
 
 Voxel Size: {voxel_size}
 
 Before:
-  Vertices: {len(trimesh.vertices):,}
-  Faces: {len(trimesh.faces):,}
+  Vertices: {initial_vertices:,}
+  Faces: {initial_faces:,}
 
 After:
-  Vertices: {len(remeshed_mesh.vertices):,}
-  Faces: {len(remeshed_mesh.faces):,}
+  Vertices: {remeshed_vertices:,}
+  Faces: {remeshed_faces:,}
 """
         return remeshed_mesh, info
 
     def _blender_quadriflow(self, trimesh, target_face_count):
         """Blender Quadriflow remeshing."""
-        script = f"""
-import bpy
-
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
-
-# Import mesh
-bpy.ops.wm.obj_import(filepath='{{input_path}}')
-
-# Get imported object
-obj = bpy.context.selected_objects[0]
-bpy.context.view_layer.objects.active = obj
-
-# Apply Quadriflow remesh
-bpy.ops.object.quadriflow_remesh(
-    use_mesh_symmetry=False,
-    use_preserve_sharp=False,
-    use_preserve_boundary=False,
-    smooth_normals=False,
-    mode='FACES',
-    target_faces={target_face_count},
-    seed=0
-)
-
-# Export remeshed object
-bpy.ops.wm.obj_export(
-    filepath='{{output_path}}',
-    export_selected_objects=True,
-    export_uv=False,
-    export_materials=False
-)
-"""
-
+        initial_vertices = len(trimesh.vertices)
+        initial_faces = len(trimesh.faces)
         print(f"[Remesh] Running Blender Quadriflow (target_faces={target_face_count})...")
-        remeshed_mesh = blender_bridge.run_blender_mesh_operation(
-            trimesh, script,
+        remeshed_mesh = blender_bridge.run_blender_mesh_script(
+            trimesh, 'quadriflow_remesh.py', ['--target-faces', int(target_face_count)],
             metadata_key='remeshing',
             metadata_values={
                 'algorithm': 'blender_quadriflow',
                 'target_face_count': target_face_count,
-                'original_vertices': len(trimesh.vertices),
-                'original_faces': len(trimesh.faces)
+                'original_vertices': initial_vertices,
+                'original_faces': initial_faces
             }
         )
 
+        remeshed_vertices = len(remeshed_mesh.vertices)
+        remeshed_faces = len(remeshed_mesh.faces)
+
         info = f"""Remesh Results (Blender Quadriflow):
 
 Target Face Count: {target_face_count:,}
 
 Before:
-  Vertices: {len(trimesh.vertices):,}
-  Faces: {len(trimesh.faces):,}
+  Vertices: {initial_vertices:,}
+  Faces: {initial_faces:,}
 
 After:
-  Vertices: {len(remeshed_mesh.vertices):,}
-  Faces: {len(remeshed_mesh.faces):,}
+  Vertices: {remeshed_vertices:,}
+  Faces: {remeshed_faces:,}
 
 Quadriflow creates quad-dominant meshes with good topology.
 """
@@ -383,6 +484,8 @@ Quadriflow creates quad-dominant meshes with good topology.
 
     def _instant_meshes(self, trimesh, target_vertex_count, deterministic, crease_angle):
         """Instant Meshes field-aligned remeshing."""
+        initial_vertices = len(trimesh.vertices)
+        initial_faces = len(trimesh.faces)
         try:
             import pynanoinstantmeshes as pynano
         except ImportError:
@@ -390,8 +493,10 @@ Quadriflow creates quad-dominant meshes with good topology.
                 "PyNanoInstantMeshes not installed. Install with: pip install PyNanoInstantMeshes"
             )
 
-        V = trimesh.vertices.astype(np.float32)
-        F = trimesh.faces.astype(np.uint32)
+        # The binding works in float32 / uint32; ascontiguousarray only
+        # copies when the input is not already in that layout
+        V = np.ascontiguousarray(trimesh.vertices, dtype=np.float32)
+        F = np.ascontiguousarray(trimesh.faces, dtype=np.uint32)
 
         V_out, F_out = pynano.remesh(
             V, F,
@@ -413,10 +518,13 @@ Quadriflow creates quad-dominant meshes with good topology.
             'target_vertex_count': target_vertex_count,
             'deterministic': deterministic == "true",
             'crease_angle': crease_angle,
-            'original_vertices': len(trimesh.vertices),
-            'original_faces': len(trimesh.faces)
+            'original_vertices': initial_vertices,
+            'original_faces': initial_faces
         }
 
+        remeshed_vertices = len(remeshed_mesh.vertices)
+        remeshed_faces = len(remeshed_mesh.faces)
+
         info = f"""Remesh Results (Instant Meshes):
 
 Target Vertex Count: {target_vertex_count:,}
@@ -424,12 +532,12 @@ Deterministic: {deterministic}
 Crease Angle: {crease_angle}
 
 Before:
-  Vertices: {len(trimesh.vertices):,}
-  Faces: {len(trimesh.faces):,}
+  Vertices: {initial_vertices:,}
+  Faces: {initial_faces:,}
 
 After:
-  Vertices: {len(remeshed_mesh.vertices):,}
-  Faces: {len(remeshed_mesh.faces):,}
+  Vertices: {remeshed_vertices:,}
+  Faces: {remeshed_faces:,}
 
 Instant Meshes creates flow-aligned quad meshes.
 """
@@ -437,6 +545,8 @@ Instant Meshes creates flow-aligned quad meshes.
 
     def _cumesh(self, trimesh, remesh_band, target_face_count):
         """CuMesh GPU dual-contouring remeshing (same algorithm as TRELLIS2)."""
+        initial_vertices = len(trimesh.vertices)
+        initial_faces = len(trimesh.faces)
         import torch
         import cumesh as CuMesh
 
@@ -451,19 +561,20 @@ Instant Meshes creates flow-aligned quad meshes.
 
         # Simplify to target face count
         pre_simplify_faces = len(remeshed_mesh.faces)
-        vertices = torch.tensor(remeshed_mesh.vertices, dtype=torch.float32).cuda()
-        faces = torch.tensor(remeshed_mesh.faces, dtype=torch.int32).cuda()
+        # from_numpy shares the (already converted) buffer instead of copying it again
+        vertices = torch.from_numpy(np.ascontiguousarray(remeshed_mesh.vertices, dtype=np.float32)).cuda()
+        faces = torch.from_numpy(np.ascontiguousarray(remeshed_mesh.faces, dtype=np.int32)).cuda()
 
         cumesh_obj = CuMesh.CuMesh()
         cumesh_obj.init(vertices, faces)
 
         # Skip pre-simplify unify on large meshes - CuMesh crashes on >2M faces
         # TRELLIS2 does unify here, but their mesh comes from a different path
-        if len(faces) < 2_000_000:
+        if pre_simplify_faces < 2_000_000:
             cumesh_obj.unify_face_orientations()
             print(f"[Remesh] Unified face orientations (pre-simplify)")
         else:
-            print(f"[Remesh] Skipping pre-simplify unify (mesh too large: {len(faces):,} faces)")
+            print(f"[Remesh] Skipping pre-simplify unify (mesh too large: {pre_simplify_faces:,} faces)")
 
         # Simplify to target
         cumesh_obj.simplify(target_face_count, verbose=True)
@@ -479,6 +590,7 @@ Instant Meshes creates flow-aligned quad meshes.
             faces=final_faces.cpu().numpy(),
             process=False
         )
+        remeshed_faces = len(remeshed_mesh.faces)
 
         # Preserve metadata
         remeshed_mesh.metadata = trimesh.metadata.copy()
@@ -486,8 +598,8 @@ Instant Meshes creates flow-aligned quad meshes.
             'algorithm': 'cumesh',
             'remesh_band': remesh_band,
             'target_face_count': target_face_count,
-            'original_vertices': len(trimesh.vertices),
-            'original_faces': len(trimesh.faces)
+            'original_vertices': initial_vertices,
+            'original_faces': initial_faces
         }
 
         info = f"""Remesh Results (CuMesh):
@@ -496,11 +608,11 @@ Band Width: {remesh_band}
 Target Face Count: {target_face_count:,}
 
 Before:
-  Vertices: {len(trimesh.vertices):,}
-  Faces: {len(trimesh.faces):,}
+  Vertices: {initial_vertices:,}
+  Faces: {initial_faces:,}
 
 After Remesh: {pre_simplify_faces:,} faces
-After Simplify: {len(remeshed_mesh.faces):,} faces
+After Simplify: {remeshed_faces:,} faces
 
 GPU-accelerated dual contouring (same algorithm as TRELLIS2).
 """
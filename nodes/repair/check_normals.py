@@ -40,7 +40,18 @@ class CheckNormalsNode:
         Returns:
             tuple: (report_string,)
         """
-        print(f"[CheckNormals] Analyzing mesh with {len(trimesh.vertices)} vertices, {len(trimesh.faces)} faces")
+        num_vertices = len(trimesh.vertices)
+        num_faces = len(trimesh.faces)
+        print(f"[CheckNormals] Analyzing mesh with {num_vertices} vertices, {num_faces} faces")
+
+        # Face normals and the degeneracy checks below share trimesh's cached
+        # cross products
+        face_normals = trimesh.face_normals
+        cross = trimesh.triangles_cross
+
+        # Unique edges feed both the watertight check and the edge count;
+        # trimesh caches them, but only read the property once here
+        num_edges = len(trimesh.edges_unique)
 
         # Check winding consistency
         is_winding_consistent = trimesh.is_winding_consistent
@@ -48,33 +59,33 @@ class CheckNormalsNode:
         # Check if watertight (implies consistent normals typically)
         is_watertight = trimesh.is_watertight
 
-        # Get face normals and check for degenerate triangles
-        face_normals = trimesh.face_normals
-        face_areas = trimesh.area_faces
+        # One pass over the cross products gives both checks: the squared
+        # magnitude is (2 * area)^2 and is NaN wherever a normal would be
+        cross_sq = np.einsum('ij,ij->i', cross, cross)
 
-        # Find degenerate faces (zero or near-zero area)
-        degenerate_faces = np.sum(face_areas < 1e-10)
+        # Find degenerate faces (zero or near-zero area, i.e. area < 1e-10)
+        degenerate_faces = int(np.count_nonzero(cross_sq < 4e-20))
 
-        # Check for NaN normals (indicates degenerate geometry)
-        nan_normals = np.sum(np.isnan(face_normals).any(axis=1))
+        # Check for NaN normals (indicates degenerate geometry); trimesh zeroes
+        # the normals it cannot compute, so look at the cross products instead
+        nan_normals = int(np.count_nonzero(np.isnan(cross_sq)))
 
         # Calculate normal statistics
-        normal_lengths = np.linalg.norm(face_normals, axis=1)
-        avg_normal_length = np.mean(normal_lengths)
+        avg_normal_length = np.mean(np.linalg.norm(face_normals, axis=1))
 
         report = f"""=== Normal Consistency Analysis ===
 
 Mesh Statistics:
-  Vertices: {len(trimesh.vertices):,}
-  Faces: {len(trimesh.faces):,}
-  Edges: {len(trimesh.edges_unique):,}
+  Vertices: {num_vertices:,}
+  Faces: {num_faces:,}
+  Edges: {num_edges:,}
 
 Topology:
   Winding Consistent: {'✓ Yes' if is_winding_consistent else '✗ No (normals may point in mixed directions)'}
   Watertight: {'✓ Yes' if is_watertight else '✗ No (has boundary edges/holes)'}
 
 Face Quality:
-  Degenerate Faces: {degenerate_faces:,} ({100.0 * degenerate_faces / len(trimesh.faces):.2f}%)
+  Degenerate Faces: {degenerate_faces:,} ({100.0 * degenerate_faces / num_faces:.2f}%)
   NaN Normals: {nan_normals:,}
   Avg Normal Length: {avg_normal_length:.6f} (should be ~1.0)
 
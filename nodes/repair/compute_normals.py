@@ -8,6 +8,16 @@ Recompute mesh normals with custom settings.
 import numpy as np
 import trimesh
 
+from .._utils import mesh_ops
+
+
+_NORMAL_FIELDS = ('normal_x', 'normal_y', 'normal_z', 'normal_magnitude')
+
+
+def _geometry_key(mesh):
+    """Content key of the vertex and face arrays (trimesh caches the hashes)."""
+    return f"{hash(mesh.vertices):x}:{hash(mesh.faces):x}"
+
 
 class ComputeNormalsNode:
     """
@@ -46,24 +56,34 @@ class ComputeNormalsNode:
         """
         print(f"[ComputeNormals] Processing mesh with {len(trimesh.vertices)} vertices, {len(trimesh.faces)} faces")
 
-        # Create a copy
-        result_mesh = trimesh.copy()
+        # Normals from an earlier run are still valid if the smoothing matches
+        # and the geometry they were computed for is unchanged
+        smooth = smooth_vertex_normals != "false"
+        metadata = trimesh.metadata
+        if (metadata.get('normals_smoothed') == smooth
+                and all(name in trimesh.vertex_attributes for name in _NORMAL_FIELDS)
+                and metadata.get('normals_geometry_key') == _geometry_key(trimesh)):
+            print(f"[ComputeNormals] {'Smooth' if smooth else 'Faceted'} normals already up to date")
+            return (trimesh,)
+
+        # Copy without duplicating the buffers; only attributes and metadata change
+        result_mesh = mesh_ops.shallow_copy_mesh(trimesh)
 
         # Face normals are always recomputed automatically by trimesh
         # But we can force a cache clear and recomputation
         result_mesh._cache.clear()
 
-        if smooth_vertex_normals == "false":
+        if not smooth:
             # Use face normals directly (faceted appearance)
             # This creates sharp edges by not averaging normals across faces
+            # One unbuffered scatter-add of each face normal onto its three corners
             vertex_normals = np.zeros_like(result_mesh.vertices)
-            for i, face in enumerate(result_mesh.faces):
-                face_normal = result_mesh.face_normals[i]
-                vertex_normals[face] += face_normal
+            np.add.at(vertex_normals, result_mesh.faces.ravel(),
+                      np.repeat(result_mesh.face_normals, 3, axis=0))
             # Normalize
             norms = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
             norms[norms == 0] = 1  # Avoid division by zero
-            vertex_normals = vertex_normals / norms
+            vertex_normals /= norms
 
             # Store in mesh (note: trimesh will override this with smoothed normals)
             # So we need to mark it in metadata
@@ -90,6 +110,8 @@ class ComputeNormalsNode:
 
             print(f"[ComputeNormals] Computed smooth vertex normals")
 
+        result_mesh.metadata['normals_geometry_key'] = _geometry_key(result_mesh)
+
         return (result_mesh,)
 
 
@@ -9,6 +9,8 @@ import os
 import numpy as np
 import trimesh
 
+from .._utils import self_intersections
+
 
 class DetectSelfIntersectionsNode:
     """
@@ -49,23 +51,20 @@ class DetectSelfIntersectionsNode:
         result_mesh = trimesh.copy()
 
         try:
-            # Try to use libigl with CGAL for robust detection
-            import igl
-
-            # Check if CGAL functions are available
+            # Prefer libigl with CGAL for robust detection
             try:
                 import igl.copyleft.cgal as cgal
                 has_cgal = hasattr(cgal, 'remesh_self_intersections')
             except (ImportError, AttributeError):
                 has_cgal = False
 
+            # Convert mesh to numpy arrays with proper dtypes
+            V = np.asarray(trimesh.vertices, dtype=np.float64)
+            F = np.asarray(trimesh.faces, dtype=np.int64)
+
+            IF = None
             if has_cgal:
                 print("[DetectSelfIntersections] Using libigl CGAL method")
-
-                # Convert mesh to numpy arrays with proper dtypes
-                V = np.asarray(trimesh.vertices, dtype=np.float64)
-                F = np.asarray(trimesh.faces, dtype=np.int64)
-
                 # Use remesh_self_intersections in detect-only mode
                 # This returns intersection information without modifying the mesh
                 try:
@@ -75,82 +74,55 @@ class DetectSelfIntersectionsNode:
                         first_only=False,
                         stitch_all=False
                     )
-
-                    # IF contains pairs of intersecting faces [n x 2]
-                    intersecting_faces_list = []  # For UI display
-                    num_pairs = 0
-
-                    if IF.shape[0] > 0:
-                        # Get unique face indices that are involved in intersections
-                        intersecting_faces = np.unique(IF.flatten())
-                        num_intersecting = len(intersecting_faces)
-                        num_pairs = IF.shape[0]
-
-                        # Create scalar field for faces
-                        face_field = np.zeros(len(F), dtype=np.float32)
-                        face_field[intersecting_faces] = 1.0
-                        result_mesh.face_attributes['self_intersecting'] = face_field
-
-                        # Propagate to vertices - a vertex is marked if any adjacent face intersects
-                        vertex_field = np.zeros(len(V), dtype=np.float32)
-                        for face_idx in intersecting_faces:
-                            vertex_indices = F[face_idx]
-                            vertex_field[vertex_indices] = 1.0
-                        result_mesh.vertex_attributes['intersection_flag'] = vertex_field
-
-                        # Count how many intersecting faces each vertex touches
-                        vertex_count = np.zeros(len(V), dtype=np.float32)
-                        for face_idx in intersecting_faces:
-                            vertex_indices = F[face_idx]
-                            vertex_count[vertex_indices] += 1.0
-                        result_mesh.vertex_attributes['intersection_count'] = vertex_count
-
-                        # Build face details for UI
-                        for face_idx in intersecting_faces:
-                            intersecting_faces_list.append({
-                                "id": int(face_idx),
-                                "vertices": F[face_idx].tolist()
-                            })
-
-                        print(f"[DetectSelfIntersections] Found {num_intersecting} intersecting faces ({num_pairs} intersection pairs)")
-
-                    else:
-                        # No intersections found
-                        num_intersecting = 0
-                        # Add zero fields for visualization
-                        result_mesh.face_attributes['self_intersecting'] = np.zeros(len(F), dtype=np.float32)
-                        result_mesh.vertex_attributes['intersection_flag'] = np.zeros(len(V), dtype=np.float32)
-                        result_mesh.vertex_attributes['intersection_count'] = np.zeros(len(V), dtype=np.float32)
-                        print("[DetectSelfIntersections] No self-intersections detected")
-
                 except Exception as e:
                     print(f"[DetectSelfIntersections] CGAL detection failed: {e}")
-                    # Fallback to basic method
-                    num_intersecting = 0
-                    num_pairs = 0
-                    intersecting_faces_list = []
-                    result_mesh.face_attributes['self_intersecting'] = np.zeros(len(trimesh.faces), dtype=np.float32)
-                    result_mesh.vertex_attributes['intersection_flag'] = np.zeros(len(trimesh.vertices), dtype=np.float32)
-                    result_mesh.vertex_attributes['intersection_count'] = np.zeros(len(trimesh.vertices), dtype=np.float32)
-                    print("[DetectSelfIntersections] Falling back to zero fields (CGAL error)")
-
+                    has_cgal = False
+
+            if IF is None:
+                print("[DetectSelfIntersections] CGAL not available, using built-in detection")
+                IF = self_intersections.intersecting_face_pairs(V, F)
+
+            # IF contains pairs of intersecting faces [n x 2]
+            intersecting_faces_list = []  # For UI display
+            num_pairs = int(IF.shape[0])
+
+            # Get unique face indices that are involved in intersections
+            intersecting_faces = np.unique(np.asarray(IF).ravel())
+            num_intersecting = len(intersecting_faces)
+
+            # Create scalar field for faces
+            face_field = np.zeros(len(F), dtype=np.float32)
+            face_field[intersecting_faces] = 1.0
+            result_mesh.face_attributes['self_intersecting'] = face_field
+
+            # Both vertex fields share one float32 block (one row per field)
+            vertex_fields = np.empty((2, len(V)), dtype=np.float32)
+
+            # Count how many intersecting faces each vertex touches
+            intersecting_corners = F[intersecting_faces]
+            vertex_fields[0] = np.bincount(intersecting_corners.ravel(), minlength=len(V))
+            result_mesh.vertex_attributes['intersection_count'] = vertex_fields[0]
+
+            # Propagate to vertices - a vertex is marked if any adjacent face intersects
+            np.greater(vertex_fields[0], 0, out=vertex_fields[1])
+            result_mesh.vertex_attributes['intersection_flag'] = vertex_fields[1]
+
+            # Build face details for UI
+            for face_idx, vertex_indices in zip(intersecting_faces.tolist(),
+                                                intersecting_corners.tolist()):
+                intersecting_faces_list.append({
+                    "id": face_idx,
+                    "vertices": vertex_indices
+                })
+
+            if num_intersecting:
+                print(f"[DetectSelfIntersections] Found {num_intersecting} intersecting faces ({num_pairs} intersection pairs)")
             else:
-                # CGAL not available - use basic fallback
-                print("[DetectSelfIntersections] CGAL not available, using basic detection")
-                num_intersecting = 0
-                num_pairs = 0
-                intersecting_faces_list = []
-
-                # Add zero fields
-                result_mesh.face_attributes['self_intersecting'] = np.zeros(len(trimesh.faces), dtype=np.float32)
-                result_mesh.vertex_attributes['intersection_flag'] = np.zeros(len(trimesh.vertices), dtype=np.float32)
-                result_mesh.vertex_attributes['intersection_count'] = np.zeros(len(trimesh.vertices), dtype=np.float32)
-
-                print("[DetectSelfIntersections] ⚠ CGAL not available - install with: pip install cgal")
+                print("[DetectSelfIntersections] No self-intersections detected")
 
             # Store metadata
             result_mesh.metadata['has_intersection_field'] = True
-            result_mesh.metadata['intersection_detection_method'] = 'libigl_cgal' if has_cgal else 'none'
+            result_mesh.metadata['intersection_detection_method'] = 'libigl_cgal' if has_cgal else 'builtin'
 
             # Generate report
             percentage = (100.0 * num_intersecting / len(trimesh.faces)) if len(trimesh.faces) > 0 else 0.0
@@ -163,7 +135,7 @@ Mesh Statistics:
 
 Detection Results:
   Intersecting Faces: {num_intersecting:,} ({percentage:.1f}%)
-  Detection Method: {'libigl CGAL' if has_cgal else 'Basic (CGAL unavailable)'}
+  Detection Method: {'libigl CGAL' if has_cgal else 'Built-in (CGAL unavailable)'}
 
 Status:
   {'✓ No self-intersections detected!' if num_intersecting == 0 else '⚠ Self-intersections found!'}
@@ -173,7 +145,7 @@ Scalar Fields Added:
   • vertex: 'intersection_flag' (1.0 = adjacent to intersection)
   • vertex: 'intersection_count' (number of intersecting faces touching vertex)
 
-{'' if has_cgal else '⚠ Note: CGAL not available. Install for accurate detection: pip install cgal'}
+{'' if has_cgal else '⚠ Note: CGAL not available. The built-in check uses floating point and skips faces sharing a vertex. Install for exact detection: pip install cgal'}
 
 Use 'Preview Mesh (VTK with Fields)' node to visualize the intersection fields!
 """
@@ -199,20 +171,6 @@ Use 'Preview Mesh (VTK with Fields)' node to visualize the intersection fields!
                 }
             }
 
-        except ImportError as e:
-            # libigl not available at all
-            error_msg = f"""Error: libigl not available
-
-{str(e)}
-
-Self-intersection detection requires libigl with CGAL support.
-Install with: pip install libigl cgal
-
-For now, returning mesh unchanged.
-"""
-            print(f"[DetectSelfIntersections] libigl import error: {e}")
-            return (trimesh, error_msg)
-
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -8,6 +8,8 @@ Fill holes in mesh by adding new faces.
 import trimesh
 import numpy as np
 
+from .._utils import mesh_ops
+
 try:
     import cumesh as CuMesh
     import torch
@@ -98,8 +100,9 @@ class FillHolesNode:
         initial_vertices = len(mesh.vertices)
         initial_faces = len(mesh.faces)
 
-        # Create a copy
-        filled_mesh = mesh.copy()
+        # Copy without duplicating the buffers: every method either builds a new
+        # mesh or (trimesh) appends faces by assigning a new array
+        filled_mesh = mesh_ops.shallow_copy_mesh(mesh)
 
         # Track method actually used (for fallback cases)
         method_used = method
@@ -183,12 +183,10 @@ Returning mesh unchanged.
                     result_mesh.face_attributes['self_intersecting'] = face_field
 
                     # Update vertex attributes
-                    vertex_field = np.zeros(len(V), dtype=np.float32)
-                    vertex_count = np.zeros(len(V), dtype=np.float32)
-                    for face_idx in intersecting_faces:
-                        vertex_indices = F[face_idx]
-                        vertex_field[vertex_indices] = 1.0
-                        vertex_count[vertex_indices] += 1.0
+                    vertex_count = np.bincount(
+                        F[intersecting_faces].ravel(), minlength=len(V)
+                    ).astype(np.float32)
+                    vertex_field = (vertex_count > 0).astype(np.float32)
                     result_mesh.vertex_attributes['intersection_flag'] = vertex_field
                     result_mesh.vertex_attributes['intersection_count'] = vertex_count
 
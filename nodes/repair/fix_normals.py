@@ -8,6 +8,8 @@ Fix inconsistent normal orientations.
 import trimesh
 import numpy as np
 
+from .._utils import mesh_ops
+
 try:
     import igl
     HAS_IGL = True
@@ -190,8 +192,9 @@ class FixNormalsNode:
         """
         print(f"[FixNormals] Input: {len(trimesh.vertices)} vertices, {len(trimesh.faces)} faces")
 
-        # Create a copy to avoid modifying the original
-        fixed_mesh = trimesh.copy()
+        # Copy without duplicating the vertices (only the winding changes);
+        # the faces are copied since trimesh's fix_normals flips them in place
+        fixed_mesh = mesh_ops.shallow_copy_mesh(trimesh, copy_faces=True)
 
         # Check initial winding consistency
         was_consistent = fixed_mesh.is_winding_consistent
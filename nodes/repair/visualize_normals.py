@@ -49,13 +49,18 @@ class VisualizNormalFieldNode:
         # Get vertex normals
         normals = result_mesh.vertex_normals
 
-        # Add each component as a scalar field
-        result_mesh.vertex_attributes['normal_x'] = normals[:, 0].astype(np.float32)
-        result_mesh.vertex_attributes['normal_y'] = normals[:, 1].astype(np.float32)
-        result_mesh.vertex_attributes['normal_z'] = normals[:, 2].astype(np.float32)
-
+        # All four fields live in one float32 block, one contiguous row per
+        # field, instead of four separately cast arrays
+        fields = np.empty((4, len(normals)), dtype=np.float32)
+        fields[:3] = normals.T
         # Also add normal magnitude (should be ~1.0 for unit normals)
-        normal_magnitude = np.linalg.norm(normals, axis=1).astype(np.float32)
+        fields[3] = np.sqrt(np.einsum('ij,ij->j', fields[:3], fields[:3]))
+        normal_magnitude = fields[3]
+
+        # Add each component as a scalar field (views into the block)
+        result_mesh.vertex_attributes['normal_x'] = fields[0]
+        result_mesh.vertex_attributes['normal_y'] = fields[1]
+        result_mesh.vertex_attributes['normal_z'] = fields[2]
         result_mesh.vertex_attributes['normal_magnitude'] = normal_magnitude
 
         info = f"""Normal Field Visualization:
@@ -268,7 +268,7 @@ bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete()
 
 # Import mesh with original UVs (GLB preserves materials better than OBJ)
-bpy.ops.import_scene.gltf(filepath='{source_glb.name}')
+bpy.ops.import_scene.gltf(filepath={source_glb.name!r})
 objs = bpy.context.selected_objects
 
 print(f"[Blender] Imported {{len(objs)}} objects")
@@ -357,7 +357,7 @@ bpy.context.view_layer.objects.active = remeshed_obj
 
 print(f"[Blender] Exporting remeshed object: {{len(remeshed_obj.data.vertices)}} vertices, {{len(remeshed_obj.data.polygons)}} faces")
 bpy.ops.export_scene.gltf(
-    filepath='{output_glb.name}',
+    filepath={output_glb.name!r},
     use_selection=True,
     export_format='GLB',
     export_texcoords=True,
@@ -543,7 +543,7 @@ bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete()
 
 # Import mesh
-bpy.ops.wm.obj_import(filepath='{{input_path}}')
+bpy.ops.wm.obj_import(filepath={{input_path!r}})
 
 # Get imported object
 obj = bpy.context.selected_objects[0]
@@ -557,7 +557,7 @@ bpy.ops.object.mode_set(mode='OBJECT')
 
 # Export with UVs
 bpy.ops.wm.obj_export(
-    filepath='{{output_path}}',
+    filepath={{output_path!r}},
     export_selected_objects=True,
     export_uv=True,
     export_materials=False
@@ -614,7 +614,7 @@ bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete()
 
 # Import mesh
-bpy.ops.wm.obj_import(filepath='{{input_path}}')
+bpy.ops.wm.obj_import(filepath={{input_path!r}})
 
 # Get imported object
 obj = bpy.context.selected_objects[0]
@@ -628,7 +628,7 @@ bpy.ops.object.mode_set(mode='OBJECT')
 
 # Export with UVs
 bpy.ops.wm.obj_export(
-    filepath='{{output_path}}',
+    filepath={{output_path!r}},
     export_selected_objects=True,
     export_uv=True,
     export_materials=False
@@ -679,7 +679,7 @@ bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete()
 
 # Import mesh
-bpy.ops.wm.obj_import(filepath='{{input_path}}')
+bpy.ops.wm.obj_import(filepath={{input_path!r}})
 
 # Get imported object
 obj = bpy.context.selected_objects[0]
@@ -693,7 +693,7 @@ bpy.ops.object.mode_set(mode='OBJECT')
 
 # Export with UVs
 bpy.ops.wm.obj_export(
-    filepath='{{output_path}}',
+    filepath={{output_path!r}},
     export_selected_objects=True,
     export_uv=True,
     export_materials=False
@@ -743,7 +743,7 @@ bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete()
 
 # Import mesh
-bpy.ops.wm.obj_import(filepath='{{input_path}}')
+bpy.ops.wm.obj_import(filepath={{input_path!r}})
 
 # Get imported object
 obj = bpy.context.selected_objects[0]
@@ -757,7 +757,7 @@ bpy.ops.object.mode_set(mode='OBJECT')
 
 # Export with UVs
 bpy.ops.wm.obj_export(
-    filepath='{{output_path}}',
+    filepath={{output_path!r}},
     export_selected_objects=True,
     export_uv=True,
     export_materials=False
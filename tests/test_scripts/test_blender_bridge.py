@@ -0,0 +1,169 @@
+"""Tests for the Blender bridge's mesh stream format and worker protocol (no Blender needed)."""
+
+import io
+import os
+import sys
+import textwrap
+import threading
+
+import pytest
+import numpy as np
+import trimesh
+
+from nodes._utils import blender_bridge
+
+
+class _ShortReader(io.RawIOBase):
+    """Binary stream that hands out at most a few bytes per read, like a busy pipe."""
+
+    def __init__(self, data, chunk=7):
+        self._data = io.BytesIO(data)
+        self._chunk = chunk
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._data.read(min(len(buffer), self._chunk))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _stream_bytes(mesh):
+    buf = io.BytesIO()
+    blender_bridge.write_mesh_stream(buf, mesh)
+    return buf.getvalue()
+
+
+def _assert_same_mesh(vertices, faces, mesh):
+    assert vertices.dtype == np.float32 and faces.dtype == np.int32
+    assert vertices.flags.writeable and faces.flags.writeable
+    np.testing.assert_array_equal(vertices, mesh.vertices.astype(np.float32))
+    np.testing.assert_array_equal(faces, mesh.faces)
+
+
+@pytest.mark.unit
+def test_mesh_stream_round_trip(sphere_mesh):
+    """A mesh written to the stream reads back unchanged (at float32 precision)."""
+    data = _stream_bytes(sphere_mesh)
+    assert len(data) == 16 + 12 * len(sphere_mesh.vertices) + 12 * len(sphere_mesh.faces)
+
+    vertices, faces = blender_bridge.read_mesh_stream(io.BytesIO(data))
+    _assert_same_mesh(vertices, faces, sphere_mesh)
+
+
+@pytest.mark.unit
+def test_mesh_stream_short_reads(sphere_mesh):
+    """Reads that return fewer bytes than asked for are continued, not truncated."""
+    vertices, faces = blender_bridge.read_mesh_stream(_ShortReader(_stream_bytes(sphere_mesh)))
+    _assert_same_mesh(vertices, faces, sphere_mesh)
+
+
+@pytest.mark.unit
+def test_mesh_stream_through_pipe(sphere_mesh):
+    """The stream survives an OS pipe, written and read concurrently."""
+    read_fd, write_fd = os.pipe()
+
+    def write():
+        with open(write_fd, 'wb') as f:
+            blender_bridge.write_mesh_stream(f, sphere_mesh)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    with open(read_fd, 'rb', buffering=0) as f:
+        vertices, faces = blender_bridge.read_mesh_stream(f)
+    writer.join()
+    _assert_same_mesh(vertices, faces, sphere_mesh)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("keep", [0, 10, 16, 100])
+def test_truncated_mesh_stream(sphere_mesh, keep):
+    """A stream cut short raises EOFError instead of returning partial arrays."""
+    data = _stream_bytes(sphere_mesh)[:keep]
+    with pytest.raises(EOFError, match="truncated"):
+        blender_bridge.read_mesh_stream(io.BytesIO(data))
+
+
+@pytest.mark.unit
+def test_empty_mesh_stream():
+    """A mesh without vertices or faces is still a valid stream."""
+    mesh = trimesh.Trimesh(vertices=np.empty((0, 3)), faces=np.empty((0, 3), dtype=np.int64), process=False)
+    vertices, faces = blender_bridge.read_mesh_stream(io.BytesIO(_stream_bytes(mesh)))
+    assert vertices.shape == (0, 3) and faces.shape == (0, 3)
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    """
+    BlenderWorker running blender_scripts/worker.py under plain Python.
+
+    A minimal bpy module stands in for Blender; the worker only needs
+    bpy.data.meshes to purge orphans between jobs.
+    """
+    fake_bpy = tmp_path / "fake_bpy"
+    fake_bpy.mkdir()
+    (fake_bpy / "bpy.py").write_text("class data:\n    meshes = []\n")
+    monkeypatch.setenv("PYTHONPATH", str(fake_bpy))
+    monkeypatch.setattr(blender_bridge, "INTERRUPT_AVAILABLE", False)
+    monkeypatch.setattr(
+        blender_bridge, "_blender_command",
+        lambda *args: [sys.executable, str(blender_bridge.BLENDER_SCRIPTS_DIR / "worker.py")]
+    )
+
+    worker = blender_bridge.BlenderWorker()
+    yield worker
+    worker.close()
+
+
+def _script(tmp_path, name, body):
+    path = tmp_path / name
+    path.write_text(textwrap.dedent(body))
+    return path
+
+
+@pytest.mark.unit
+def test_worker_reply_after_log_output(worker, tmp_path):
+    """Log lines before the reply are skipped; the job's arguments reach the script."""
+    out = tmp_path / "out.txt"
+    script = _script(tmp_path, "job.py", """
+        import sys
+        print("Blender-style log line")
+        print("partial line without newline", end="")
+        open(sys.argv[sys.argv.index('--') + 1], 'w').write(' '.join(sys.argv[sys.argv.index('--') + 2:]))
+    """)
+
+    assert worker.run_script(script, [out, "--size", 0.5], timeout=60) is True
+    assert out.read_text() == "--size 0.5"
+
+    # The same process serves the next job
+    proc = worker._proc
+    assert worker.run_script(script, [out, "again"], timeout=60) is True
+    assert worker._proc is proc
+    assert out.read_text() == "again"
+
+
+@pytest.mark.unit
+def test_worker_error_reply(worker, tmp_path):
+    """A failing script comes back as RuntimeError with its traceback; the worker survives."""
+    failing = _script(tmp_path, "fail.py", "raise ValueError('bad voxel size')\n")
+    with pytest.raises(RuntimeError, match="bad voxel size"):
+        worker.run_script(failing, timeout=60)
+
+    ok = _script(tmp_path, "ok.py", "pass\n")
+    assert worker.run_script(ok, timeout=60) is True
+
+
+@pytest.mark.unit
+def test_worker_crash(worker, tmp_path):
+    """A worker that exits without replying raises BlenderWorkerCrashed and is restarted."""
+    crash = _script(tmp_path, "crash.py", """
+        import os
+        print("about to crash", flush=True)
+        os._exit(3)
+    """)
+    with pytest.raises(blender_bridge.BlenderWorkerCrashed, match="about to crash"):
+        worker.run_script(crash, timeout=60)
+
+    ok = _script(tmp_path, "ok.py", "pass\n")
+    assert worker.run_script(ok, timeout=60) is True
@@ -0,0 +1,81 @@
+"""Tests for the in-process isotropic remesher (nodes/_utils/isotropic_remesh.py)."""
+
+import pytest
+import numpy as np
+import trimesh
+
+from nodes._utils.isotropic_remesh import isotropic_remesh
+
+
+def _remesh(mesh, target_edge_length, **kwargs):
+    vertices, faces = isotropic_remesh(mesh.vertices, mesh.faces, target_edge_length, **kwargs)
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+
+def _boundary_edges(mesh):
+    """Boundary edges as a set of sorted coordinate pairs (independent of numbering)."""
+    edges = mesh.edges_sorted[trimesh.grouping.group_rows(mesh.edges_sorted, require_count=1)]
+    points = np.round(mesh.vertices[edges], 9)
+    return {tuple(sorted(map(tuple, pair))) for pair in points}
+
+
+@pytest.fixture
+def hemisphere():
+    """Coarse open mesh: the upper half of an icosphere."""
+    mesh = trimesh.creation.icosphere(subdivisions=3)
+    mesh.update_faces(mesh.triangles_center[:, 2] > 0)
+    mesh.remove_unreferenced_vertices()
+    return mesh
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("target", [0.08, 0.25])
+def test_edge_lengths_converge_to_target(target):
+    """Refining and coarsening both land near the target edge length."""
+    mesh = trimesh.creation.icosphere(subdivisions=3)
+    remeshed = _remesh(mesh, target)
+
+    lengths = remeshed.edges_unique_length
+    assert abs(np.median(lengths) - target) < 0.2 * target
+    assert np.mean((lengths > 0.6 * target) & (lengths < 1.5 * target)) > 0.9
+
+
+@pytest.mark.unit
+def test_closed_mesh_stays_watertight():
+    """A closed surface keeps its topology: watertight, consistently wound, same Euler number."""
+    mesh = trimesh.creation.icosphere(subdivisions=3)
+    remeshed = _remesh(mesh, 0.1)
+
+    assert remeshed.is_watertight
+    assert remeshed.is_winding_consistent
+    assert remeshed.euler_number == mesh.euler_number
+    # Vertices stay on the input surface
+    np.testing.assert_allclose(np.linalg.norm(remeshed.vertices, axis=1), 1.0, atol=0.01)
+
+
+@pytest.mark.unit
+def test_open_mesh_boundary_is_preserved(hemisphere):
+    """With protect_boundaries the border is kept exactly and the interior is still refined."""
+    target = 0.05
+    remeshed = _remesh(hemisphere, target, protect_boundaries=True)
+
+    assert _boundary_edges(remeshed) == _boundary_edges(hemisphere)
+    assert remeshed.euler_number == hemisphere.euler_number
+    # Only the faces on the (over-long) border edges stay coarse
+    assert len(remeshed.faces) > 10 * len(hemisphere.faces)
+    assert np.median(remeshed.edges_unique_length) < 1.33 * target
+
+
+@pytest.mark.unit
+def test_open_mesh_boundary_is_refined_without_protection(hemisphere):
+    """Without protect_boundaries the border edges are split as well."""
+    remeshed = _remesh(hemisphere, 0.05, protect_boundaries=False)
+    assert len(_boundary_edges(remeshed)) > len(_boundary_edges(hemisphere))
+
+
+@pytest.mark.unit
+def test_empty_input():
+    """A mesh without faces comes back empty."""
+    vertices, faces = isotropic_remesh(np.empty((0, 3)), np.empty((0, 3), dtype=np.int64), 0.1)
+    assert vertices.shape == (0, 3)
+    assert faces.shape == (0, 3)
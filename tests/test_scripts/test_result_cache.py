@@ -0,0 +1,137 @@
+"""Tests for the on-disk result cache (nodes/_utils/result_cache.py)."""
+
+import os
+
+import pytest
+import numpy as np
+
+from nodes._utils import result_cache
+
+
+def _counting(compute):
+    """Wrap compute so the test can tell cache hits from recomputes."""
+    calls = []
+
+    def wrapped():
+        calls.append(1)
+        return compute()
+    return wrapped, calls
+
+
+def _entries(cache_dir):
+    return sorted(p.name for p in cache_dir.glob("*.npz"))
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Enable the cache in a per-test directory."""
+    monkeypatch.setenv("GEOMPACK_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("GEOMPACK_CACHE_SIZE_GB", raising=False)
+    return tmp_path
+
+
+@pytest.mark.unit
+def test_round_trip_keeps_attributes_and_metadata(sphere_mesh, cache_dir):
+    """A cache hit returns the same geometry, attributes, info and metadata."""
+    sphere_mesh.metadata["file_name"] = "sphere.obj"
+
+    def compute():
+        result = sphere_mesh.subdivide()
+        result.vertex_attributes["col3"] = np.random.rand(len(result.vertices), 3).astype(np.float32)
+        result.face_attributes["label"] = np.arange(len(result.faces), dtype=np.int32)
+        result.metadata = sphere_mesh.metadata.copy()
+        result.metadata["refined"] = True
+        return result, "refined"
+
+    wrapped, calls = _counting(compute)
+    fresh, fresh_info = result_cache.cached_call("test", sphere_mesh, {"n": 1}, wrapped)
+    cached, cached_info = result_cache.cached_call("test", sphere_mesh, {"n": 1}, wrapped)
+
+    assert len(calls) == 1
+    assert len(_entries(cache_dir)) == 1
+    assert cached_info == fresh_info
+    np.testing.assert_array_equal(cached.vertices, fresh.vertices)
+    np.testing.assert_array_equal(cached.faces, fresh.faces)
+    assert sorted(cached.vertex_attributes) == ["col3"]
+    assert sorted(cached.face_attributes) == ["label"]
+    np.testing.assert_array_equal(cached.vertex_attributes["col3"], fresh.vertex_attributes["col3"])
+    np.testing.assert_array_equal(cached.face_attributes["label"], fresh.face_attributes["label"])
+    assert cached.metadata["refined"] is True
+    assert cached.metadata["file_name"] == "sphere.obj"
+
+
+@pytest.mark.unit
+def test_key_changes_with_params_and_versions(sphere_mesh, cache_dir):
+    """Different parameters or backend versions never share an entry."""
+    wrapped, calls = _counting(lambda: (sphere_mesh.subdivide(), "info"))
+    result_cache.cached_call("test", sphere_mesh, {"n": 1}, wrapped)
+    result_cache.cached_call("test", sphere_mesh, {"n": 2}, wrapped)
+    result_cache.cached_call("test", sphere_mesh, {"n": 2}, wrapped, versions=lambda: {"lib": "2.0"})
+
+    assert len(calls) == 3
+    assert len(_entries(cache_dir)) == 3
+
+
+@pytest.mark.unit
+def test_pass_through_result_is_not_stored(sphere_mesh, cache_dir):
+    """Returning the input mesh unchanged writes no entry."""
+    wrapped, calls = _counting(lambda: (sphere_mesh, "nothing to do"))
+    result_cache.cached_call("test", sphere_mesh, {}, wrapped)
+    result, _ = result_cache.cached_call("test", sphere_mesh, {}, wrapped)
+
+    assert result is sphere_mesh
+    assert len(calls) == 2
+    assert _entries(cache_dir) == []
+
+
+@pytest.mark.unit
+def test_results_with_visuals_are_not_stored(sphere_mesh, cache_dir):
+    """Colors cannot round-trip through an entry, so such results are recomputed."""
+    def compute():
+        result = sphere_mesh.copy()
+        result.visual.vertex_colors = [255, 0, 0, 255]
+        return result, "colored"
+
+    wrapped, calls = _counting(compute)
+    result_cache.cached_call("test", sphere_mesh, {}, wrapped)
+    result_cache.cached_call("test", sphere_mesh, {}, wrapped)
+
+    assert len(calls) == 2
+    assert _entries(cache_dir) == []
+
+
+@pytest.mark.unit
+def test_least_recently_used_entry_is_evicted(sphere_mesh, cache_dir, monkeypatch):
+    """Writing past the size bound removes the oldest entry."""
+    result_cache.cached_call("test", sphere_mesh, {"n": 1}, lambda: (sphere_mesh.subdivide(), "a"))
+    (first,) = cache_dir.glob("*.npz")
+    old = first.stat().st_mtime - 100
+    os.utime(first, (old, old))
+
+    # Room for one entry but not two
+    size_gb = 1.5 * first.stat().st_size / (1 << 30)
+    monkeypatch.setenv("GEOMPACK_CACHE_SIZE_GB", repr(size_gb))
+    result_cache.cached_call("test", sphere_mesh, {"n": 2}, lambda: (sphere_mesh.subdivide(), "b"))
+
+    remaining = _entries(cache_dir)
+    assert len(remaining) == 1
+    assert first.name not in remaining
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("configured", [None, ""])
+def test_cache_disabled_without_directory(sphere_mesh, tmp_path, monkeypatch, configured):
+    """Caching is opt-in: unset or empty GEOMPACK_CACHE_DIR always recomputes."""
+    if configured is None:
+        monkeypatch.delenv("GEOMPACK_CACHE_DIR", raising=False)
+    else:
+        monkeypatch.setenv("GEOMPACK_CACHE_DIR", configured)
+    monkeypatch.chdir(tmp_path)
+
+    assert result_cache.cache_dir() is None
+    wrapped, calls = _counting(lambda: (sphere_mesh.subdivide(), "info"))
+    result_cache.cached_call("test", sphere_mesh, {}, wrapped)
+    result_cache.cached_call("test", sphere_mesh, {}, wrapped)
+
+    assert len(calls) == 2
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,112 @@
+"""Tests for the built-in self-intersection detector (nodes/_utils/self_intersections.py)."""
+
+import pytest
+import numpy as np
+import trimesh
+
+from nodes._utils import self_intersections
+
+
+def _concatenate(*meshes):
+    return trimesh.util.concatenate(list(meshes))
+
+
+def _intersecting_faces(mesh):
+    pairs = self_intersections.intersecting_face_pairs(mesh.vertices, mesh.faces)
+    assert pairs.ndim == 2 and pairs.shape[1] == 2
+    assert np.all(pairs[:, 0] < pairs[:, 1])
+    return set(np.unique(pairs).tolist())
+
+
+@pytest.mark.unit
+def test_clean_icosphere_has_no_intersections():
+    """Adjacent faces of a closed surface touch but never intersect."""
+    mesh = trimesh.creation.icosphere(subdivisions=3)
+    assert _intersecting_faces(mesh) == set()
+
+
+@pytest.mark.unit
+def test_crossing_boxes():
+    """Only faces that cross the other box's surface are reported."""
+    first = trimesh.creation.box(extents=[1.0, 1.0, 1.0])
+    second = first.copy()
+    second.apply_translation([0.5, 0.3, 0.2])
+    mesh = _concatenate(first, second)
+
+    faces = _intersecting_faces(mesh)
+    assert faces
+    # Each box's far faces (e.g. first's -X side) stay clear of the other box
+    centers = mesh.triangles_center
+    assert all(centers[f, 0] > -0.5 + 1e-9 for f in faces)
+    assert any(f < len(first.faces) for f in faces)
+    assert any(f >= len(first.faces) for f in faces)
+
+
+@pytest.mark.unit
+def test_crossing_spheres():
+    """Two overlapping spheres intersect in a ring of faces on each sphere."""
+    first = trimesh.creation.icosphere(subdivisions=3)
+    second = first.copy()
+    second.apply_translation([1.2, 0.0, 0.0])
+    mesh = _concatenate(first, second)
+
+    faces = np.array(sorted(_intersecting_faces(mesh)))
+    assert len(faces) > 0
+    # The spheres cross at x = 0.6
+    x = mesh.triangles[faces][:, :, 0]
+    assert np.all((x.min(axis=1) <= 0.6) & (x.max(axis=1) >= 0.6))
+
+
+@pytest.mark.unit
+def test_coplanar_overlap():
+    """Overlapping triangles in the same plane intersect; disjoint ones do not."""
+    vertices = np.array([
+        [0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0],
+        [0.2, 0.2, 0.0], [1.2, 0.2, 0.0], [0.2, 1.2, 0.0],
+        [5.0, 5.0, 0.0], [6.0, 5.0, 0.0], [5.0, 6.0, 0.0],
+    ])
+    faces = np.array([[0, 1, 2], [3, 4, 5], [6, 7, 8]])
+    pairs = self_intersections.intersecting_face_pairs(vertices, faces)
+    assert pairs.tolist() == [[0, 1]]
+
+
+@pytest.mark.unit
+def test_duplicate_faces_overlap():
+    """A face duplicated on separate vertices overlaps its copy."""
+    box = trimesh.creation.box(extents=[1.0, 1.0, 1.0])
+    mesh = _concatenate(box, box.copy())
+    assert _intersecting_faces(mesh) == set(range(len(mesh.faces)))
+
+
+@pytest.mark.unit
+def test_faces_sharing_a_vertex_are_skipped():
+    """A folded fan meets only at its shared vertex."""
+    vertices = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0],
+                         [-1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+    faces = np.array([[0, 1, 2], [0, 3, 4]])
+    assert self_intersections.intersecting_face_pairs(vertices, faces).shape == (0, 2)
+
+
+@pytest.mark.unit
+def test_wide_extent_scene():
+    """Tiny faces spread over a large extent do not need a dense grid."""
+    sphere = trimesh.creation.icosphere(subdivisions=3, radius=1e-4)
+    far = sphere.copy()
+    far.apply_translation([1e3, 0.0, 0.0])
+    assert _intersecting_faces(_concatenate(sphere, far)) == set()
+
+    overlapping = sphere.copy()
+    overlapping.apply_translation([1.2e-4, 0.0, 0.0])
+    faces = _intersecting_faces(_concatenate(sphere, far, overlapping))
+    assert faces
+    # Nothing on the far sphere is involved
+    far_faces = range(len(sphere.faces), 2 * len(sphere.faces))
+    assert faces.isdisjoint(far_faces)
+
+
+@pytest.mark.unit
+def test_too_few_faces():
+    """Meshes with fewer than two faces have nothing to intersect."""
+    vertices = np.eye(3)
+    assert self_intersections.intersecting_face_pairs(vertices, np.empty((0, 3), dtype=np.int64)).shape == (0, 2)
+    assert self_intersections.intersecting_face_pairs(vertices, np.array([[0, 1, 2]])).shape == (0, 2)